@@ -104,6 +104,11 @@ class ConfigManager:
 
         config[keys[-1]] = value
 
+    def update(self, values):
+        """Set several configuration values from a dict of (dot notation) keys"""
+        for key, value in values.items():
+            self.set(key, value)
+
     def save(self):
         """Save current configuration to file"""
         config_path = self._get_config_path()
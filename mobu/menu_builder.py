@@ -265,6 +265,16 @@ class MenuBuilder:
             importlib.reload(core.utils)
             print("[xMobu] Core modules reloaded")
 
+            # Shared utilities, before the tools that import from them
+            # (this also drops the cached .ui file contents)
+            import mobu.utils.mobu_utils
+            import mobu.utils.character_presets
+            import mobu.utils
+            importlib.reload(mobu.utils.mobu_utils)
+            importlib.reload(mobu.utils.character_presets)
+            importlib.reload(mobu.utils)
+            print("[xMobu] Utility modules reloaded")
+
             # Reload tool modules
             print("[xMobu] Reloading tool modules...")
             import mobu.tools.animation.keyframe_tools
@@ -279,10 +289,14 @@ class MenuBuilder:
 
             importlib.reload(mobu.tools.animation.keyframe_tools)
             importlib.reload(mobu.tools.animation.anim_exporter)
+            # Like settings, the Character Mapper dialog is only hidden on close
+            mobu.tools.character.character_mapper_qt.destroy_dialog()
             importlib.reload(mobu.tools.character.character_mapper_qt)
             importlib.reload(mobu.tools.character.auto_characterize)
             importlib.reload(mobu.tools.character.constraint_manager_qt)
             importlib.reload(mobu.tools.pipeline.scene_manager)
+            # The settings dialog outlives close; drop it so reopening uses the reloaded code
+            mobu.tools.pipeline._settings_qt.destroy_dialog()
             importlib.reload(mobu.tools.pipeline._settings_qt)
             importlib.reload(mobu.tools.unreal.content_browser)
             importlib.reload(mobu.tools.debug.random_objects)
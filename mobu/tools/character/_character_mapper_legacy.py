@@ -12,9 +12,10 @@ from pyfbsdk import (
 )
 from core.decorators import CreateUniqueTool
 from core.logger import logger
+from mobu.utils import CHARACTER_SLOTS, SLOT_INDEX, NONE_LABELS, PRESET_ENCODER, PresetIndex
 from pathlib import Path
 import json
-import shutil
+import os
 
 TOOL_NAME = "Character Mapper"
 
@@ -26,51 +27,17 @@ def execute(control, event):
     return tool
 
 
-# Character bone slots in logical order
-# Using only guaranteed FBBodyNodeId attributes
-CHARACTER_SLOTS = [
-    # Reference
-    ("Reference", "Reference"),
-
-    # Hips and Spine (using string names for flexibility)
-    ("Hips", "Hips"),
-    ("Spine", "Spine"),
-    ("Spine1", "Spine1"),
-    ("Spine2", "Spine2"),
-    ("Spine3", "Spine3"),
-    ("Spine4", "Spine4"),
-    ("Spine5", "Spine5"),
-    ("Spine6", "Spine6"),
-    ("Spine7", "Spine7"),
-    ("Spine8", "Spine8"),
-    ("Spine9", "Spine9"),
-
-    # Neck and Head
-    ("Neck", "Neck"),
-    ("Head", "Head"),
-
-    # Left Arm
-    ("LeftShoulder", "LeftShoulder"),
-    ("LeftArm", "LeftArm"),
-    ("LeftForeArm", "LeftForeArm"),
-    ("LeftHand", "LeftHand"),
-
-    # Right Arm
-    ("RightShoulder", "RightShoulder"),
-    ("RightArm", "RightArm"),
-    ("RightForeArm", "RightForeArm"),
-    ("RightHand", "RightHand"),
-
-    # Left Leg
-    ("LeftUpLeg", "LeftUpLeg"),
-    ("LeftLeg", "LeftLeg"),
-    ("LeftFoot", "LeftFoot"),
-
-    # Right Leg
-    ("RightUpLeg", "RightUpLeg"),
-    ("RightLeg", "RightLeg"),
-    ("RightFoot", "RightFoot"),
-]
+# Slots that must be mapped before characterizing, in the order they are reported
+REQUIRED_SLOTS = ("Hips", "LeftUpLeg", "RightUpLeg", "Spine")
+
+# (slot name, FBCharacter link property name), in CHARACTER_SLOTS order
+SLOT_LINKS = [(slot_name, slot_name + "Link") for slot_name, _ in CHARACTER_SLOTS]
+
+# Presets are a few KB; anything far larger is not a character preset
+MAX_PRESET_BYTES = 256 * 1024
+
+# Presets directory, created and cached by the first tool instance
+_PRESET_DIR = None
 
 
 @CreateUniqueTool
@@ -82,8 +49,14 @@ class CharacterMapperUI(FBTool):
         self.character = None
         self.bone_mappings = {}  # slot_name -> model
         self.all_models = []  # Store all scene models
+        self.all_names = []  # LongName of each entry in all_models
         self.filtered_models = []  # Store filtered models
+        self.filtered_names = []  # LongName of each entry in filtered_models
+        self._displayed_names = None  # Names currently shown in objects_list
+        self._name_to_model = {}  # LongName -> model, rebuilt with all_models
         self.preset_path = self._get_preset_path()
+        self._preset_index = PresetIndex(self.preset_path)  # Scanned on first lookup
+        self.system = FBSystem()  # Scene is read from it on every reload
 
         # Register file callbacks for auto-refresh
         self.app = FBApplication()
@@ -120,10 +93,14 @@ class CharacterMapperUI(FBTool):
 
     def _get_preset_path(self):
         """Get the path to the presets directory"""
-        root = Path(__file__).parent.parent.parent.parent
-        preset_dir = root / "presets" / "characters"
-        preset_dir.mkdir(parents=True, exist_ok=True)
-        return preset_dir
+        global _PRESET_DIR
+
+        if _PRESET_DIR is None:
+            root = Path(__file__).parents[3]
+            preset_dir = root / "presets" / "characters"
+            preset_dir.mkdir(parents=True, exist_ok=True)
+            _PRESET_DIR = preset_dir
+        return _PRESET_DIR
 
     def BuildUI(self):
         """Build the tool interface"""
@@ -138,14 +115,14 @@ class CharacterMapperUI(FBTool):
         self.AddRegion("main", "main", x, y, w, h)
         self.SetControl("main", main)
 
-        # Split into sections
-        x_left = FBAddRegionParam(0, FBAttachType.kFBAttachLeft, "")
+        # Split into sections; the outer edges reuse the main region params
+        x_left = x
         x_right = FBAddRegionParam(300, FBAttachType.kFBAttachLeft, "")
-        x_end = FBAddRegionParam(0, FBAttachType.kFBAttachRight, "")
+        x_end = w
 
-        y_top = FBAddRegionParam(0, FBAttachType.kFBAttachTop, "")
+        y_top = y
         y_mid = FBAddRegionParam(-150, FBAttachType.kFBAttachBottom, "")
-        y_bottom = FBAddRegionParam(0, FBAttachType.kFBAttachBottom, "")
+        y_bottom = h
 
         # Left panel - Bone mapping
         mapping_layout = FBLayout()
@@ -195,9 +172,9 @@ class CharacterMapperUI(FBTool):
         layout.SetControl("mappings", self.mapping_list)
 
         # Populate with character slots
-        for slot_name, _ in CHARACTER_SLOTS:
-            self.mapping_list.Items.append(f"{slot_name}: <None>")
-            self.bone_mappings[slot_name] = None
+        for label in NONE_LABELS:
+            self.mapping_list.Items.append(label)
+        self.bone_mappings = dict.fromkeys(SLOT_INDEX)
 
     def _build_objects_panel(self, layout):
         """Build the scene objects panel"""
@@ -250,21 +227,11 @@ class CharacterMapperUI(FBTool):
         layout.AddRegion("objects_list", "objects_list", x, y_list_top, w, y_list_bottom)
         layout.SetControl("objects_list", self.objects_list)
 
-        # Refresh button
-        refresh_btn = FBButton()
-        refresh_btn.Caption = "Refresh Scene"
-        refresh_btn.OnClick.Add(self.OnRefreshScene)
-
-        layout.AddRegion("refresh_btn", "refresh_btn", x, y_btn1_top, w, y_btn1_bottom)
-        layout.SetControl("refresh_btn", refresh_btn)
-
-        # Assign button
-        assign_btn = FBButton()
-        assign_btn.Caption = "Assign to Selected Slot"
-        assign_btn.OnClick.Add(self.OnAssignBone)
-
-        layout.AddRegion("assign_btn", "assign_btn", x, y_btn2_top, w, y_btn2_bottom)
-        layout.SetControl("assign_btn", assign_btn)
+        # Refresh and assign buttons
+        self._add_button(layout, "refresh_btn", "Refresh Scene", self.OnRefreshScene,
+                         (x, y_btn1_top, w, y_btn1_bottom))
+        self._add_button(layout, "assign_btn", "Assign to Selected Slot", self.OnAssignBone,
+                         (x, y_btn2_top, w, y_btn2_bottom))
 
     def _build_actions_panel(self, layout):
         """Build the actions panel"""
@@ -273,32 +240,28 @@ class CharacterMapperUI(FBTool):
         x_col2 = FBAddRegionParam(0, FBAttachType.kFBAttachRight, "")
         x_col2_start = FBAddRegionParam(-205, FBAttachType.kFBAttachRight, "")
 
-        # Row positions (top and bottom for each row)
-        y_row1_top = FBAddRegionParam(5, FBAttachType.kFBAttachTop, "")
-        y_row1_bot = FBAddRegionParam(35, FBAttachType.kFBAttachTop, "")
-
-        y_row2_top = FBAddRegionParam(40, FBAttachType.kFBAttachTop, "")
-        y_row2_bot = FBAddRegionParam(70, FBAttachType.kFBAttachTop, "")
-
-        y_row3_top = FBAddRegionParam(75, FBAttachType.kFBAttachTop, "")
-        y_row3_bot = FBAddRegionParam(105, FBAttachType.kFBAttachTop, "")
-
-        y_row4_top = FBAddRegionParam(110, FBAttachType.kFBAttachTop, "")
-        y_row4_bot = FBAddRegionParam(140, FBAttachType.kFBAttachTop, "")
-
-        # Characterize
-        char_btn = FBButton()
-        char_btn.Caption = "Create Character"
-        char_btn.OnClick.Add(self.OnCharacterize)
-        layout.AddRegion("char_btn", "char_btn", x_col1, y_row1_top, x_col2_start, y_row1_bot)
-        layout.SetControl("char_btn", char_btn)
-
-        # Clear
-        clear_btn = FBButton()
-        clear_btn.Caption = "Clear Mapping"
-        clear_btn.OnClick.Add(self.OnClearMapping)
-        layout.AddRegion("clear_btn", "clear_btn", x_col2_start, y_row1_top, x_col2, y_row1_bot)
-        layout.SetControl("clear_btn", clear_btn)
+        # Row positions (top and bottom for each row), 30 high with a 5 gap
+        rows = [
+            (FBAddRegionParam(top, FBAttachType.kFBAttachTop, ""),
+             FBAddRegionParam(top + 30, FBAttachType.kFBAttachTop, ""))
+            for top in (5, 40, 75, 110)
+        ]
+        y_row2_top, y_row2_bot = rows[1]
+
+        # Buttons: (region name, caption, handler, row, column)
+        columns = ((x_col1, x_col2_start), (x_col2_start, x_col2))
+        buttons = [
+            ("char_btn", "Create Character", self.OnCharacterize, 0, 0),
+            ("clear_btn", "Clear Mapping", self.OnClearMapping, 0, 1),
+            ("save_btn", "Save Preset", self.OnSavePreset, 2, 0),
+            ("load_btn", "Load Preset", self.OnLoadPreset, 2, 1),
+            ("export_btn", "Export Preset...", self.OnExportPreset, 3, 0),
+            ("import_btn", "Import Preset...", self.OnImportPreset, 3, 1),
+        ]
+        for name, caption, handler, row, column in buttons:
+            x_start, x_end = columns[column]
+            y_top, y_bot = rows[row]
+            self._add_button(layout, name, caption, handler, (x_start, y_top, x_end, y_bot))
 
         # Preset name
         preset_label = FBLabel()
@@ -311,66 +274,67 @@ class CharacterMapperUI(FBTool):
         layout.AddRegion("preset_name", "preset_name", x_col2_start, y_row2_top, x_col2, y_row2_bot)
         layout.SetControl("preset_name", self.preset_name)
 
-        # Save preset
-        save_btn = FBButton()
-        save_btn.Caption = "Save Preset"
-        save_btn.OnClick.Add(self.OnSavePreset)
-        layout.AddRegion("save_btn", "save_btn", x_col1, y_row3_top, x_col2_start, y_row3_bot)
-        layout.SetControl("save_btn", save_btn)
-
-        # Load preset
-        load_btn = FBButton()
-        load_btn.Caption = "Load Preset"
-        load_btn.OnClick.Add(self.OnLoadPreset)
-        layout.AddRegion("load_btn", "load_btn", x_col2_start, y_row3_top, x_col2, y_row3_bot)
-        layout.SetControl("load_btn", load_btn)
-
-        # Export/Import
-        export_btn = FBButton()
-        export_btn.Caption = "Export Preset..."
-        export_btn.OnClick.Add(self.OnExportPreset)
-        layout.AddRegion("export_btn", "export_btn", x_col1, y_row4_top, x_col2_start, y_row4_bot)
-        layout.SetControl("export_btn", export_btn)
-
-        import_btn = FBButton()
-        import_btn.Caption = "Import Preset..."
-        import_btn.OnClick.Add(self.OnImportPreset)
-        layout.AddRegion("import_btn", "import_btn", x_col2_start, y_row4_top, x_col2, y_row4_bot)
-        layout.SetControl("import_btn", import_btn)
+    def _add_button(self, layout, name, caption, handler, region):
+        """Create a button wired to handler and place it in a new layout region
+
+        region is the (x, y, w, h) FBAddRegionParam tuple for AddRegion.
+        """
+        button = FBButton()
+        button.Caption = caption
+        button.OnClick.Add(handler)
+        layout.AddRegion(name, name, *region)
+        layout.SetControl(name, button)
+        return button
 
     def LoadSceneModels(self):
         """Load all scene models into the objects list"""
         # Clear existing lists
         self.all_models = []
-        self.filtered_models = []
-
-        # Get all models in scene
-        scene = FBSystem().Scene
-
-        for model in scene.RootModel.Children:
-            self._add_model_recursive(model)
+        self.all_names = []
+        add_model = self.all_models.append
+        add_name = self.all_names.append
+
+        # Walk the hierarchy depth-first with an explicit stack, reading each
+        # LongName once; children are pushed reversed to keep outliner order
+        scene = self.system.Scene
+        stack = list(scene.RootModel.Children)
+        stack.reverse()
+        while stack:
+            model = stack.pop()
+            add_model(model)
+            add_name(model.LongName)
+            children = list(model.Children)
+            children.reverse()
+            stack.extend(children)
+
+        # LongName lookup for presets; the first model in outliner order wins
+        name_to_model = {}
+        for name, model in zip(self.all_names, self.all_models):
+            name_to_model.setdefault(name, model)
+        self._name_to_model = name_to_model
 
         # Store filtered models (initially all)
         self.filtered_models = self.all_models[:]
+        self.filtered_names = self.all_names[:]
 
         # Update display
         self._update_objects_display()
 
-    def _add_model_recursive(self, model):
-        """Recursively add models to the list"""
-        self.all_models.append(model)
-        for child in model.Children:
-            self._add_model_recursive(child)
-
     def _update_objects_display(self):
         """Update the objects list display with filtered models"""
-        # Clear existing items
-        while len(self.objects_list.Items) > 0:
-            self.objects_list.Items.removeAt(0)
+        # Filter edits often leave the result unchanged; keep the list as it is then
+        if self.filtered_names == self._displayed_names:
+            return
+        self._displayed_names = self.filtered_names
+
+        items = self.objects_list.Items
 
-        # Add filtered models
-        for model in self.filtered_models:
-            self.objects_list.Items.append(model.LongName)
+        # Clear existing items in one call
+        items.removeAll()
+
+        # Add filtered models from the cached names
+        for name in self.filtered_names:
+            items.append(name)
 
     def OnFilterChanged(self, control, event):
         """Filter the objects list based on search text"""
@@ -379,12 +343,15 @@ class CharacterMapperUI(FBTool):
         if not filter_text:
             # No filter, show all models
             self.filtered_models = self.all_models[:]
+            self.filtered_names = self.all_names[:]
         else:
-            # Filter models by name
-            self.filtered_models = [
-                model for model in self.all_models
-                if filter_text in model.LongName.lower()
-            ]
+            # Filter models by their cached names
+            self.filtered_models = []
+            self.filtered_names = []
+            for model, name in zip(self.all_models, self.all_names):
+                if filter_text in name.lower():
+                    self.filtered_models.append(model)
+                    self.filtered_names.append(name)
 
         # Update display
         self._update_objects_display()
@@ -451,6 +418,11 @@ class CharacterMapperUI(FBTool):
 
         print(f"[Character Mapper] Selected model: {selected_model.Name} ({selected_model.LongName})")
 
+        # Re-assigning the same model leaves the slot label as it is
+        if self.bone_mappings.get(slot_name) is selected_model:
+            print(f"[Character Mapper] {slot_name} already mapped to {selected_model.LongName}")
+            return
+
         # Store mapping (store the model object, not the name)
         self.bone_mappings[slot_name] = selected_model
 
@@ -465,22 +437,29 @@ class CharacterMapperUI(FBTool):
 
     def OnClearMapping(self, control, event):
         """Clear all bone mappings"""
-        for i, (slot_name, _) in enumerate(CHARACTER_SLOTS):
-            self.bone_mappings[slot_name] = None
-            # Update display - FBList requires removeAt then insert
-            self.mapping_list.Items.removeAt(i)
-            self.mapping_list.Items.insert(i, f"{slot_name}: <None>")
+        self.bone_mappings = dict.fromkeys(SLOT_INDEX)
+        self._set_mapping_labels(NONE_LABELS)
 
         print("[Character Mapper] Cleared all mappings")
 
+    def _set_mapping_labels(self, labels):
+        """Replace every mapping list row, keeping the selected row"""
+        # One removeAll and a run of appends instead of a removeAt/insert pair per slot
+        selected = self.mapping_list.ItemIndex
+        items = self.mapping_list.Items
+        items.removeAll()
+        for label in labels:
+            items.append(label)
+        self.mapping_list.ItemIndex = selected
+
     def OnCharacterize(self, control, event):
         """Create character from current mapping"""
         print("[Character Mapper] Creating character...")
 
         try:
             # Check if we have required bones
-            required = ["Hips", "LeftUpLeg", "RightUpLeg", "Spine"]
-            missing = [slot for slot in required if not self.bone_mappings.get(slot)]
+            bone_mappings = self.bone_mappings
+            missing = [slot for slot in REQUIRED_SLOTS if not bone_mappings.get(slot)]
 
             if missing:
                 FBMessageBox(
@@ -490,21 +469,22 @@ class CharacterMapperUI(FBTool):
                 )
                 return
 
-            # Create character
+            # Create character; characterization stays off while the links are set
             self.character = FBCharacter(self.preset_name.Text or "Character")
+            self.character.SetCharacterizeOn(False)
+            find_property = self.character.PropertyList.Find
 
             # Map bones
-            for slot_name, _ in CHARACTER_SLOTS:
+            for slot_name, link_name in SLOT_LINKS:
                 model = self.bone_mappings.get(slot_name)
                 if model:
                     # Use the model object directly (no need to search)
-                    self.character.SetCharacterizeOn(False)
-                    prop_list = self.character.PropertyList.Find(slot_name + "Link")
+                    prop_list = find_property(link_name)
                     if prop_list:
                         prop_list.append(model)
                         print(f"[Character Mapper] Linked {slot_name} -> {model.Name}")
                     else:
-                        print(f"[Character Mapper WARNING] Could not find property {slot_name}Link")
+                        print(f"[Character Mapper WARNING] Could not find property {link_name}")
 
             # Characterize
             self.character.SetCharacterizeOn(True)
@@ -543,11 +523,13 @@ class CharacterMapperUI(FBTool):
             if model:
                 preset_data["mappings"][slot_name] = model.LongName
 
-        # Save to file
+        # Save to file - write compact JSON to a temp file in one call, then swap it in atomically
         preset_file = self.preset_path / f"{preset_name}.json"
         try:
-            with open(preset_file, 'w') as f:
-                json.dump(preset_data, f, indent=2)
+            tmp_file = preset_file.with_suffix(".json.tmp")
+            tmp_file.write_text(PRESET_ENCODER.encode(preset_data), encoding="utf-8")
+            os.replace(tmp_file, preset_file)
+            self._preset_index.add(preset_name)
 
             FBMessageBox(
                 "Preset Saved",
@@ -566,7 +548,7 @@ class CharacterMapperUI(FBTool):
         preset_name = self.preset_name.Text or "Character"
         preset_file = self.preset_path / f"{preset_name}.json"
 
-        if not preset_file.exists():
+        if not self._preset_index.has(preset_name):
             FBMessageBox(
                 "Preset Not Found",
                 f"Preset '{preset_name}' not found.\n\nAvailable presets in:\n{self.preset_path}",
@@ -575,28 +557,10 @@ class CharacterMapperUI(FBTool):
             return
 
         try:
-            with open(preset_file, 'r') as f:
-                preset_data = json.load(f)
+            preset_data = json.loads(preset_file.read_bytes())
 
             # Apply mappings
-            self.OnClearMapping(None, None)
-
-            # Find models by name and map them
-            for slot_name, bone_name in preset_data.get("mappings", {}).items():
-                if slot_name in self.bone_mappings:
-                    # Find the model in the scene
-                    model = self._find_model_by_name(bone_name)
-                    if model:
-                        self.bone_mappings[slot_name] = model
-
-                        # Update display
-                        for i, (s_name, _) in enumerate(CHARACTER_SLOTS):
-                            if s_name == slot_name:
-                                self.mapping_list.Items.removeAt(i)
-                                self.mapping_list.Items.insert(i, f"{slot_name}: {model.Name}")
-                                break
-                    else:
-                        print(f"[Character Mapper WARNING] Model '{bone_name}' not found in scene")
+            self._apply_mappings(preset_data)
 
             FBMessageBox("Preset Loaded", f"Preset '{preset_name}' loaded successfully!", "OK")
             print(f"[Character Mapper] Loaded preset: {preset_file}")
@@ -605,19 +569,38 @@ class CharacterMapperUI(FBTool):
             FBMessageBox("Error", f"Failed to load preset:\n{str(e)}", "OK")
             logger.error(f"Failed to load preset: {str(e)}")
 
+    def _apply_mappings(self, preset_data):
+        """Replace the current mapping with each preset slot mapped to its scene model"""
+        self.bone_mappings = dict.fromkeys(SLOT_INDEX)
+        labels = list(NONE_LABELS)
+
+        # Find models by name and map them, collecting the labels first
+        for slot_name, bone_name in preset_data.get("mappings", {}).items():
+            i = SLOT_INDEX.get(slot_name)
+            if i is None:
+                continue
+
+            # Find the model in the scene
+            model = self._find_model_by_name(bone_name)
+            if model:
+                self.bone_mappings[slot_name] = model
+                labels[i] = f"{slot_name}: {model.Name}"
+            else:
+                print(f"[Character Mapper WARNING] Model '{bone_name}' not found in scene")
+
+        # Update display once
+        self._set_mapping_labels(labels)
+
     def _find_model_by_name(self, name):
         """Find a model by its LongName in the scene"""
-        for model in self.all_models:
-            if model.LongName == name:
-                return model
-        return None
+        return self._name_to_model.get(name)
 
     def OnExportPreset(self, control, event):
         """Export preset to external file"""
         preset_name = self.preset_name.Text or "Character"
         preset_file = self.preset_path / f"{preset_name}.json"
 
-        if not preset_file.exists():
+        if not self._preset_index.has(preset_name):
             FBMessageBox(
                 "Preset Not Found",
                 f"Preset '{preset_name}' not found.\nPlease save the preset first.",
@@ -635,7 +618,8 @@ class CharacterMapperUI(FBTool):
         if popup.Execute():
             try:
                 export_path = popup.FullFilename
-                shutil.copy2(preset_file, export_path)
+                # Presets are a few KB: one read and one write, no metadata copy
+                Path(export_path).write_bytes(preset_file.read_bytes())
 
                 FBMessageBox(
                     "Export Successful",
@@ -660,38 +644,33 @@ class CharacterMapperUI(FBTool):
             try:
                 import_path = Path(popup.FullFilename)
 
-                # Read the preset
-                with open(import_path, 'r') as f:
-                    preset_data = json.load(f)
+                # Reject oversized files before reading them
+                if import_path.stat().st_size > MAX_PRESET_BYTES:
+                    FBMessageBox("Invalid Preset", "File is too large to be a character preset.", "OK")
+                    return
+
+                # Read the preset once; the same bytes are parsed and copied
+                preset_bytes = import_path.read_bytes()
+                preset_data = json.loads(preset_bytes)
+
+                # Only copy and apply files shaped like a preset
+                if not isinstance(preset_data, dict) or not isinstance(preset_data.get("mappings"), dict):
+                    FBMessageBox("Invalid Preset", "Not a character preset JSON.", "OK")
+                    return
 
                 preset_name = preset_data.get("name", import_path.stem)
 
-                # Copy to presets directory
+                # Copy to presets directory (skip if already there)
                 dest_file = self.preset_path / f"{preset_name}.json"
-                shutil.copy2(import_path, dest_file)
+                if import_path.resolve() != dest_file.resolve():
+                    dest_file.write_bytes(preset_bytes)
+                self._preset_index.add(preset_name)
 
                 # Update preset name field
                 self.preset_name.Text = preset_name
 
                 # Load the preset
-                self.OnClearMapping(None, None)
-
-                # Find models by name and map them
-                for slot_name, bone_name in preset_data.get("mappings", {}).items():
-                    if slot_name in self.bone_mappings:
-                        # Find the model in the scene
-                        model = self._find_model_by_name(bone_name)
-                        if model:
-                            self.bone_mappings[slot_name] = model
-
-                            # Update display
-                            for i, (s_name, _) in enumerate(CHARACTER_SLOTS):
-                                if s_name == slot_name:
-                                    self.mapping_list.Items.removeAt(i)
-                                    self.mapping_list.Items.insert(i, f"{slot_name}: {model.Name}")
-                                    break
-                        else:
-                            print(f"[Character Mapper WARNING] Model '{bone_name}' not found in scene")
+                self._apply_mappings(preset_data)
 
                 FBMessageBox(
                     "Import Successful",
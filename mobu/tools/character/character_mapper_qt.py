@@ -4,20 +4,25 @@ Visual character mapping with preset save/load functionality and drag-and-drop s
 """
 
 from pathlib import Path
+from functools import lru_cache
+from operator import itemgetter
+import hashlib
 import json
+import os
 import shutil
+import struct
 
 try:
     from PySide2 import QtWidgets, QtCore, QtUiTools, QtGui
     from PySide2.QtWidgets import QDialog, QMessageBox, QApplication, QListWidget, QListWidgetItem, QFileDialog
-    from PySide2.QtCore import QFile, Qt
+    from PySide2.QtCore import Qt
     from PySide2.QtGui import QDrag
 except ImportError:
     try:
         from PySide import QtGui as QtWidgets
         from PySide import QtCore, QtUiTools, QtGui
         from PySide.QtGui import QDialog, QMessageBox, QApplication, QListWidget, QListWidgetItem, QFileDialog, QDrag
-        from PySide.QtCore import QFile, Qt
+        from PySide.QtCore import Qt
     except ImportError:
         print("[Character Mapper Qt] ERROR: Neither PySide2 nor PySide found")
         QtWidgets = None
@@ -27,63 +32,84 @@ from pyfbsdk import (
     FBMatrix, FBModelNull, FBConstraintManager, FBModelTransformationType
 )
 from core.logger import logger
-from mobu.utils import get_all_models, get_children, SceneEventManager, refresh_list_widget
+from mobu.utils import (
+    get_all_models, get_children, SceneEventManager, refresh_list_widget, get_ui_bytes,
+    CHARACTER_SLOTS, SLOT_INDEX, NONE_LABELS, PRESET_ENCODER, PresetIndex
+)
 
 TOOL_NAME = "Character Mapper"
 
 # Global reference to prevent garbage collection
 _character_mapper_dialog = None
 
-
-# Character bone slots in logical order
-# REQUIRED bones: Hips, Spine, LeftUpLeg, RightUpLeg
-# OPTIONAL bones: All other bones including Spine1-9, arms, hands, feet, neck, head, etc.
-# Note: Only ONE Spine bone is required. Additional spine bones provide more control.
-CHARACTER_SLOTS = [
-    # Reference
-    ("Reference", "Reference"),
-
-    # Hips and Spine
-    ("Hips", "Hips"),                    # REQUIRED
-    ("Spine", "Spine"),                  # REQUIRED (only this one, not Spine1-9)
-    ("Spine1", "Spine1"),                # Optional
-    ("Spine2", "Spine2"),                # Optional
-    ("Spine3", "Spine3"),                # Optional
-    ("Spine4", "Spine4"),                # Optional
-    ("Spine5", "Spine5"),                # Optional
-    ("Spine6", "Spine6"),                # Optional
-    ("Spine7", "Spine7"),                # Optional
-    ("Spine8", "Spine8"),                # Optional
-    ("Spine9", "Spine9"),                # Optional
-
-    # Neck and Head
-    ("Neck", "Neck"),
-    ("Head", "Head"),
-
-    # Left Arm
-    ("LeftShoulder", "LeftShoulder"),
-    ("LeftArm", "LeftArm"),
-    ("LeftForeArm", "LeftForeArm"),
-    ("LeftHand", "LeftHand"),
-
-    # Right Arm
-    ("RightShoulder", "RightShoulder"),
-    ("RightArm", "RightArm"),
-    ("RightForeArm", "RightForeArm"),
-    ("RightHand", "RightHand"),
-
-    # Left Leg
-    ("LeftUpLeg", "LeftUpLeg"),
-    ("LeftLeg", "LeftLeg"),
-    ("LeftFoot", "LeftFoot"),
-
-    # Right Leg
-    ("RightUpLeg", "RightUpLeg"),
-    ("RightLeg", "RightLeg"),
-    ("RightFoot", "RightFoot"),
+# MIME type carrying the dragged row of the objects list, so drops can resolve
+# the model directly instead of searching by name
+MODEL_INDEX_MIME = "application/x-mobu-model-index"
+
+# UI widgets resolved in load_ui: (objectName / attribute, QtWidgets class, signal, slot)
+# Entries without a signal are only stored as attributes.
+_WIDGET_SPEC = [
+    ("searchEdit", "QLineEdit", "textChanged", "on_search_changed"),
+    ("refreshButton", "QPushButton", "clicked", "on_refresh_clicked"),
+    ("listChildrenButton", "QPushButton", "clicked", "on_list_children_clicked"),
+    ("createCharacterButton", "QPushButton", "clicked", "on_create_character"),
+    ("clearMappingButton", "QPushButton", "clicked", "on_clear_mapping"),
+    ("presetNameEdit", "QLineEdit", None, None),
+    ("savePresetButton", "QPushButton", "clicked", "on_save_preset"),
+    ("loadPresetButton", "QPushButton", "clicked", "on_load_preset"),
+    ("exportPresetButton", "QPushButton", "clicked", "on_export_preset"),
+    ("importPresetButton", "QPushButton", "clicked", "on_import_preset"),
+    ("forceTposeCheckbox", "QCheckBox", None, None),
 ]
 
 
+@lru_cache(maxsize=64)
+def _load_preset_cached(path_str, mtime_ns, size):
+    """Parse a preset file; the stat fields in the key drop stale entries when the file changes
+
+    The returned dict is shared between calls, so callers must not modify it.
+    """
+    return json.loads(Path(path_str).read_bytes())
+
+
+def _fast_copy(src, dst):
+    """Copy a file via a temp file swapped into place, letting the kernel clone/copy it where supported"""
+    # Copying onto itself would truncate the source before it is read
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+    size = os.stat(src).st_size
+    tmp_dst = f"{dst}.tmp"
+    try:
+        copied = False
+        copy_file_range = getattr(os, "copy_file_range", None)
+        if copy_file_range is not None:
+            try:
+                with open(src, 'rb') as fsrc, open(tmp_dst, 'wb') as fdst:
+                    remaining = size
+                    while remaining > 0:
+                        count = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if count == 0:
+                            break
+                        remaining -= count
+                copied = remaining == 0
+            except OSError:
+                # Cross-device or unsupported filesystem
+                pass
+
+        if copied:
+            shutil.copystat(src, tmp_dst)
+        else:
+            shutil.copy2(src, tmp_dst)
+        os.replace(tmp_dst, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp_dst)
+        except OSError:
+            pass
+        raise
+
+
 def get_mobu_main_window():
     """Get MotionBuilder's main window to use as parent"""
     try:
@@ -122,6 +148,22 @@ def execute(control, event):
     _character_mapper_dialog.show()
 
 
+def destroy_dialog():
+    """Delete the persistent Character Mapper dialog (closing it only hides it)"""
+    global _character_mapper_dialog
+
+    if _character_mapper_dialog is None:
+        return
+
+    try:
+        _character_mapper_dialog.event_manager.unregister_all()
+        _character_mapper_dialog.deleteLater()
+    except RuntimeError:
+        pass  # Already deleted on the C++ side
+    _character_mapper_dialog = None
+    print("[Character Mapper Qt] Character Mapper dialog destroyed")
+
+
 class DraggableListWidget(QListWidget):
     """Custom QListWidget that supports dragging items"""
 
@@ -140,8 +182,9 @@ class DraggableListWidget(QListWidget):
         drag = QDrag(self)
         mime_data = QtCore.QMimeData()
 
-        # Store the item text
+        # Store the item text, plus the row so the drop can skip the name lookup
         mime_data.setText(item.text())
+        mime_data.setData(MODEL_INDEX_MIME, QtCore.QByteArray(struct.pack("<i", self.row(item))))
         drag.setMimeData(mime_data)
 
         # Execute drag
@@ -184,7 +227,8 @@ class DroppableListWidget(QListWidget):
 
                 # Notify parent dialog about the drop
                 if self.parent_dialog:
-                    self.parent_dialog.on_bone_dropped(item, dropped_model_name)
+                    model = self._dropped_model(event.mimeData())
+                    self.parent_dialog.on_bone_dropped(item, dropped_model_name, model)
 
                 event.acceptProposedAction()
             else:
@@ -192,6 +236,17 @@ class DroppableListWidget(QListWidget):
         else:
             event.ignore()
 
+    def _dropped_model(self, mime_data):
+        """Resolve the dragged model from its row index, or None if unavailable"""
+        if not mime_data.hasFormat(MODEL_INDEX_MIME):
+            return None
+
+        row = struct.unpack("<i", mime_data.data(MODEL_INDEX_MIME).data())[0]
+        models = self.parent_dialog.all_models
+        if 0 <= row < len(models):
+            return models[row]
+        return None
+
 
 class CharacterMapperDialog(QDialog):
     """Character Mapper dialog using Qt Designer UI with drag-and-drop support"""
@@ -210,9 +265,15 @@ class CharacterMapperDialog(QDialog):
         self.character = None
         self.bone_mappings = {}  # slot_name -> model
         self.all_models = []  # Store all scene models
-        self.filtered_models = []  # Store filtered models
+        self._model_names_lower = []  # Lowercase names, parallel to all_models / objectsList rows
+        self._scene_sig = None  # Sorted (Name, LongName) pairs the objects list was last built from
+        self._scene_models = set()  # Models the objects list was last built from
+        self._last_preset_hash = None  # Digest of the last imported preset still applied to the mapping
+        self._import_dialog = None  # Reused preset file dialogs, created on first use
+        self._export_dialog = None
         self.selected_objects = []  # Track selected objects in objectsList (tracks order)
         self.preset_path = self._get_preset_path()
+        self._preset_index = PresetIndex(self.preset_path)  # Scanned on first lookup
         self._is_closing = False
 
         # Load the UI file
@@ -239,10 +300,9 @@ class CharacterMapperDialog(QDialog):
             self.resize(800, 600)
             self.setMinimumSize(800, 600)
 
-            loader = QtUiTools.QUiLoader()
-            file = QFile(ui_file)
+            ui_bytes = get_ui_bytes(ui_file)
 
-            if not file.exists():
+            if ui_bytes is None:
                 print(f"[Character Mapper Qt] UI file not found: {ui_file}")
                 QMessageBox.critical(
                     self,
@@ -251,10 +311,13 @@ class CharacterMapperDialog(QDialog):
                 )
                 return
 
-            file.open(QFile.ReadOnly)
+            loader = QtUiTools.QUiLoader()
+            buffer = QtCore.QBuffer()
+            buffer.setData(QtCore.QByteArray(ui_bytes))
+            buffer.open(QtCore.QIODevice.ReadOnly)
             print(f"[Character Mapper Qt] Loading UI from: {ui_file}")
-            ui_widget = loader.load(file, self)
-            file.close()
+            ui_widget = loader.load(buffer, self)
+            buffer.close()
 
             if ui_widget:
                 print(f"[Character Mapper Qt] UI widget loaded")
@@ -264,66 +327,30 @@ class CharacterMapperDialog(QDialog):
                 self.main_layout.setContentsMargins(0, 0, 0, 0)
                 self.main_layout.addWidget(ui_widget)
 
-                # Find the original list widgets
-                original_mapping_list = self.findChild(QtWidgets.QListWidget, "mappingList")
-                original_objects_list = self.findChild(QtWidgets.QListWidget, "objectsList")
-
-                # Replace with custom drag-and-drop widgets
-                if original_mapping_list:
-                    parent_widget = original_mapping_list.parent()
-                    layout = parent_widget.layout()
-
-                    # Find index in layout
-                    for i in range(layout.count()):
-                        if layout.itemAt(i).widget() == original_mapping_list:
-                            # Remove original
-                            layout.removeWidget(original_mapping_list)
-                            original_mapping_list.setParent(None)
-                            original_mapping_list.deleteLater()
-
-                            # Add custom droppable widget
-                            self.mappingList = DroppableListWidget(parent_widget)
-                            self.mappingList.setObjectName("mappingList")
-                            self.mappingList.setAlternatingRowColors(True)
-                            self.mappingList.parent_dialog = self
-                            layout.insertWidget(i, self.mappingList)
-                            break
+                # Walk the widget tree once and index it by object name
+                widgets_by_name = {w.objectName(): w for w in ui_widget.findChildren(QtWidgets.QWidget)}
 
-                if original_objects_list:
-                    parent_widget = original_objects_list.parent()
-                    layout = parent_widget.layout()
-
-                    # Find index in layout
-                    for i in range(layout.count()):
-                        if layout.itemAt(i).widget() == original_objects_list:
-                            # Remove original
-                            layout.removeWidget(original_objects_list)
-                            original_objects_list.setParent(None)
-                            original_objects_list.deleteLater()
-
-                            # Add custom draggable widget
-                            self.objectsList = DraggableListWidget(parent_widget)
-                            self.objectsList.setObjectName("objectsList")
-                            self.objectsList.setAlternatingRowColors(True)
-                            layout.insertWidget(i, self.objectsList)
-                            break
+                # Replace the original list widgets with custom drag-and-drop widgets
+                self.mappingList = self._replace_list_widget(
+                    widgets_by_name.get("mappingList"), DroppableListWidget
+                )
+                if self.mappingList:
+                    self.mappingList.parent_dialog = self
+
+                self.objectsList = self._replace_list_widget(
+                    widgets_by_name.get("objectsList"), DraggableListWidget
+                )
 
                 # Find other UI elements
-                self.searchEdit = self.findChild(QtWidgets.QLineEdit, "searchEdit")
-                self.refreshButton = self.findChild(QtWidgets.QPushButton, "refreshButton")
-                self.listChildrenButton = self.findChild(QtWidgets.QPushButton, "listChildrenButton")
-                self.createCharacterButton = self.findChild(QtWidgets.QPushButton, "createCharacterButton")
-                self.clearMappingButton = self.findChild(QtWidgets.QPushButton, "clearMappingButton")
-                self.presetNameEdit = self.findChild(QtWidgets.QLineEdit, "presetNameEdit")
-                self.savePresetButton = self.findChild(QtWidgets.QPushButton, "savePresetButton")
-                self.loadPresetButton = self.findChild(QtWidgets.QPushButton, "loadPresetButton")
-                self.exportPresetButton = self.findChild(QtWidgets.QPushButton, "exportPresetButton")
-                self.importPresetButton = self.findChild(QtWidgets.QPushButton, "importPresetButton")
-                self.forceTposeCheckbox = self.findChild(QtWidgets.QCheckBox, "forceTposeCheckbox")
+                for name, class_name, _, _ in _WIDGET_SPEC:
+                    widget = widgets_by_name.get(name)
+                    if not isinstance(widget, getattr(QtWidgets, class_name)):
+                        widget = None
+                    setattr(self, name, widget)
 
                 # Populate mapping list with character slots
+                self.mappingList.addItems(NONE_LABELS)
                 for slot_name, _ in CHARACTER_SLOTS:
-                    self.mappingList.addItem(f"{slot_name}: <None>")
                     self.bone_mappings[slot_name] = None
 
                 # Connect signals
@@ -342,52 +369,66 @@ class CharacterMapperDialog(QDialog):
             import traceback
             traceback.print_exc()
 
+    def _replace_list_widget(self, original, widget_class):
+        """Swap a Designer QListWidget for a custom subclass at the same layout position"""
+        if not original:
+            return None
+
+        parent_widget = original.parent()
+        layout = parent_widget.layout()
+
+        # Find index in layout
+        for i in range(layout.count()):
+            if layout.itemAt(i).widget() == original:
+                # Remove original
+                layout.removeWidget(original)
+                original.setParent(None)
+                original.deleteLater()
+
+                # Add custom widget
+                replacement = widget_class(parent_widget)
+                replacement.setObjectName(original.objectName())
+                replacement.setAlternatingRowColors(True)
+                layout.insertWidget(i, replacement)
+                return replacement
+
+        return None
+
     def connect_signals(self):
         """Connect UI signals to slots"""
-        if self.searchEdit:
-            self.searchEdit.textChanged.connect(self.on_search_changed)
-
         if self.objectsList:
             self.objectsList.itemClicked.connect(self.on_object_list_item_clicked)
 
-        if self.refreshButton:
-            self.refreshButton.clicked.connect(self.on_refresh_clicked)
-
-        if self.listChildrenButton:
-            self.listChildrenButton.clicked.connect(self.on_list_children_clicked)
-
-        if self.createCharacterButton:
-            self.createCharacterButton.clicked.connect(self.on_create_character)
-
-        if self.clearMappingButton:
-            self.clearMappingButton.clicked.connect(self.on_clear_mapping)
-
-        if self.savePresetButton:
-            self.savePresetButton.clicked.connect(self.on_save_preset)
-
-        if self.loadPresetButton:
-            self.loadPresetButton.clicked.connect(self.on_load_preset)
-
-        if self.exportPresetButton:
-            self.exportPresetButton.clicked.connect(self.on_export_preset)
-
-        if self.importPresetButton:
-            self.importPresetButton.clicked.connect(self.on_import_preset)
+        for name, _, signal, slot in _WIDGET_SPEC:
+            widget = getattr(self, name, None)
+            if widget is None or signal is None:
+                continue
+            getattr(widget, signal).connect(getattr(self, slot))
 
         print("[Character Mapper Qt] Signals connected")
 
     def closeEvent(self, event):
-        """Handle dialog close event"""
-        global _character_mapper_dialog
-
+        """Handle dialog close event - hide and keep the dialog for the next open"""
         self._is_closing = True
 
-        # Unregister event callbacks
+        # Unregister event callbacks while hidden
         if hasattr(self, 'event_manager'):
             self.event_manager.unregister_all()
 
-        _character_mapper_dialog = None
-        event.accept()
+        self.hide()
+        event.ignore()
+
+    def showEvent(self, event):
+        """Handle dialog show event - resume scene tracking after a close"""
+        super(CharacterMapperDialog, self).showEvent(event)
+
+        if self._is_closing:
+            self._is_closing = False
+            self.event_manager.register_file_events(self.on_file_event, events=['new', 'open', 'merge'])
+            self.event_manager.register_scene_changes(self.on_scene_change)
+            # File events were missed while hidden, so the mapping may point
+            # at models from a scene that is no longer open
+            self._reset_scene_state()
 
     def on_file_event(self, pCaller, pEvent):
         """Callback for file operations (new/open/merge)"""
@@ -395,8 +436,12 @@ class CharacterMapperDialog(QDialog):
             return
 
         print(f"[Character Mapper Qt] File event detected, refreshing scene list")
+        self._reset_scene_state()
+
+    def _reset_scene_state(self):
+        """Rebuild the objects list and drop selections and mappings from the previous scene"""
+        self._scene_sig = None
         self.update_scene_objects()
-        # Clear selections and mappings on file operations
         self.selected_objects = []
         self.on_clear_mapping()
 
@@ -425,14 +470,32 @@ class CharacterMapperDialog(QDialog):
         """Update the objects list with current scene objects, filtering cameras"""
         print("[Character Mapper Qt] update_scene_objects() called")
 
-        # Get all models from scene
-        all_models = get_all_models()
-
-        # Filter out cameras
-        self.all_models = [model for model in all_models if not isinstance(model, FBCamera)]
-
-        # Sort by name for easier finding
-        self.all_models.sort(key=lambda x: x.Name)
+        # Get all models from scene, filtering out cameras during the walk
+        models = get_all_models(exclude_types=(FBCamera,))
+
+        # Read each name from the SDK once; sorting, the signature, the list
+        # and the search index all reuse the extracted names
+        entries = sorted(((m.Name, m.LongName, m) for m in models), key=itemgetter(0))
+        names = [name for name, _, _ in entries]
+        self.all_models = [model for _, _, model in entries]
+        scene_set = set(self.all_models)
+
+        # Skip the list rebuild if the scene still has the same models/names
+        # (e.g. repeated events for an unrelated change). LongName is part of
+        # the signature because presets resolve bones by it first.
+        scene_sig = tuple((name, long_name) for name, long_name, _ in entries)
+        if scene_sig == self._scene_sig:
+            if scene_set != self._scene_models:
+                # A model was deleted and recreated under the same name: drop
+                # selected models that left the scene, and let a re-import of
+                # the same preset map the new models
+                self.selected_objects[:] = [obj for obj in self.selected_objects if obj in scene_set]
+                self._last_preset_hash = None
+                self._scene_models = scene_set
+            print("[Character Mapper Qt] Scene unchanged, skipping list rebuild")
+            return
+        self._scene_sig = scene_sig
+        self._scene_models = scene_set
 
         # Use utility function to refresh the list widget
         success = refresh_list_widget(
@@ -440,32 +503,38 @@ class CharacterMapperDialog(QDialog):
             list_widget_name="objectsList",
             models=self.all_models,
             selected_objects=self.selected_objects,
-            tool_name="Character Mapper Qt"
+            tool_name="Character Mapper Qt",
+            names=names,
+            list_widget=getattr(self, 'objectsList', None)
         )
 
         if success:
+            # Models changed, so a re-import may now resolve different bones
+            self._last_preset_hash = None
+
+            # Rows now match all_models; re-apply any active search by hiding rows
+            self._model_names_lower = [name.lower() for name in names]
+            self.apply_filter()
             print(f"[Character Mapper Qt] List updated with {len(self.all_models)} objects (cameras filtered)")
             print(f"[Character Mapper Qt] UI refresh complete")
         else:
+            self._scene_sig = None
             print("[Character Mapper Qt] Failed to refresh list widget")
 
-    def apply_filter(self):
-        """Apply search filter to objects list"""
-        filter_text = self.searchEdit.text().lower() if self.searchEdit else ""
+    def _populate_objects_list(self):
+        """Fill the objects list with every model in all_models (filtering only hides rows)"""
+        names = [model.Name for model in self.all_models]
+        self._model_names_lower = [name.lower() for name in names]
 
-        # Clear list
         self.objectsList.clear()
+        self.objectsList.addItems(names)
 
-        # Filter and populate
-        if not filter_text:
-            # No filter, show all
-            for model in self.all_models:
-                self.objectsList.addItem(model.Name)
-        else:
-            # Filter by name
-            for model in self.all_models:
-                if filter_text in model.Name.lower():
-                    self.objectsList.addItem(model.Name)
+    def apply_filter(self):
+        """Apply search filter to objects list by hiding non-matching rows"""
+        filter_text = self.searchEdit.text().lower() if self.searchEdit else ""
+
+        for i, name_lower in enumerate(self._model_names_lower):
+            self.objectsList.setRowHidden(i, filter_text not in name_lower)
 
     def on_search_changed(self, text):
         """Handle search text change"""
@@ -560,6 +629,9 @@ class CharacterMapperDialog(QDialog):
         # Update the all_models list to only show children
         self.all_models = children
         self.all_models.sort(key=lambda x: x.Name)
+        self._populate_objects_list()
+        # The list no longer shows the whole scene - force the next refresh to rebuild it
+        self._scene_sig = None
 
         # Clear selections when listing children
         for obj in self.selected_objects:
@@ -574,8 +646,12 @@ class CharacterMapperDialog(QDialog):
         print(f"[Character Mapper Qt] Showing {len(children)} children of {selected_object.Name}")
         print("[Character Mapper Qt] ===== LIST CHILDREN COMPLETE =====")
 
-    def on_bone_dropped(self, target_item, dropped_model_name):
-        """Handle a bone being dropped onto a character slot"""
+    def on_bone_dropped(self, target_item, dropped_model_name, model=None):
+        """Handle a bone being dropped onto a character slot
+
+        If the drop already resolved the model from its row index it is passed
+        in directly; otherwise the model is looked up by name.
+        """
         # Get the slot index
         slot_index = self.mappingList.row(target_item)
         if slot_index < 0 or slot_index >= len(CHARACTER_SLOTS):
@@ -584,11 +660,11 @@ class CharacterMapperDialog(QDialog):
         slot_name = CHARACTER_SLOTS[slot_index][0]
 
         # Find the model
-        model = None
-        for m in self.all_models:
-            if m.Name == dropped_model_name:
-                model = m
-                break
+        if model is None:
+            for m in self.all_models:
+                if m.Name == dropped_model_name:
+                    model = m
+                    break
 
         if not model:
             print(f"[Character Mapper Qt] WARNING: Model '{dropped_model_name}' not found")
@@ -596,6 +672,7 @@ class CharacterMapperDialog(QDialog):
 
         # Store mapping
         self.bone_mappings[slot_name] = model
+        self._last_preset_hash = None
 
         # Update display
         target_item.setText(f"{slot_name}: {model.Name}")
@@ -604,11 +681,12 @@ class CharacterMapperDialog(QDialog):
 
     def on_clear_mapping(self):
         """Clear all bone mappings"""
+        self._last_preset_hash = None
         for i, (slot_name, _) in enumerate(CHARACTER_SLOTS):
             self.bone_mappings[slot_name] = None
             item = self.mappingList.item(i)
             if item:
-                item.setText(f"{slot_name}: <None>")
+                item.setText(NONE_LABELS[i])
 
         print("[Character Mapper Qt] Cleared all mappings")
 
@@ -944,11 +1022,13 @@ class CharacterMapperDialog(QDialog):
             if model:
                 preset_data["mappings"][slot_name] = model.LongName
 
-        # Save to file
+        # Save to file - write compact JSON to a temp file, then swap it in atomically
         preset_file = self.preset_path / f"{preset_name}.json"
         try:
-            with open(preset_file, 'w') as f:
-                json.dump(preset_data, f, indent=2)
+            tmp_file = preset_file.with_suffix(".json.tmp")
+            tmp_file.write_text(PRESET_ENCODER.encode(preset_data), encoding="utf-8")
+            os.replace(tmp_file, preset_file)
+            self._preset_index.add(preset_name)
 
             QMessageBox.information(
                 self,
@@ -989,7 +1069,11 @@ class CharacterMapperDialog(QDialog):
         print(f"[Character Mapper Qt] Loading preset: {preset_name}")
         preset_file = self.preset_path / f"{preset_name}.json"
 
-        if not preset_file.exists():
+        # One stat both checks the preset exists and keys the parse cache
+        try:
+            stat = preset_file.stat()
+        except OSError:
+            # Missing, or a name that is not a valid file name on this platform
             QMessageBox.warning(
                 self,
                 "Preset Not Found",
@@ -998,31 +1082,28 @@ class CharacterMapperDialog(QDialog):
             return
 
         try:
-            with open(preset_file, 'r') as f:
-                preset_data = json.load(f)
+            preset_data = _load_preset_cached(str(preset_file), stat.st_mtime_ns, stat.st_size)
 
             # Clear and apply mappings
             self.on_clear_mapping()
 
             # Find models by name and map them
+            model_lookup = self._build_model_lookup()
             loaded_count = 0
             for slot_name, bone_name in preset_data.get("mappings", {}).items():
                 print(f"[Character Mapper Qt] Looking for {slot_name} -> '{bone_name}'")
                 if slot_name in self.bone_mappings:
                     # Find the model
-                    model = self._find_model_by_name(bone_name)
+                    model = model_lookup.get(bone_name)
                     if model:
                         self.bone_mappings[slot_name] = model
                         loaded_count += 1
                         print(f"[Character Mapper Qt] ✓ Found and mapped {slot_name} -> {model.Name} (LongName: {model.LongName})")
 
                         # Update display
-                        for i, (s_name, _) in enumerate(CHARACTER_SLOTS):
-                            if s_name == slot_name:
-                                item = self.mappingList.item(i)
-                                if item:
-                                    item.setText(f"{slot_name}: {model.Name}")
-                                break
+                        item = self.mappingList.item(SLOT_INDEX[slot_name])
+                        if item:
+                            item.setText(f"{slot_name}: {model.Name}")
                     else:
                         print(f"[Character Mapper Qt] ✗ Model '{bone_name}' not found in scene")
                         print(f"[Character Mapper Qt]   Available models: {[m.Name for m in self.all_models[:5]]}...")
@@ -1038,19 +1119,25 @@ class CharacterMapperDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to load preset:\n{str(e)}")
             logger.error(f"Failed to load preset: {str(e)}")
 
-    def _find_model_by_name(self, name):
-        """Find a model by its LongName or Name"""
-        # First try exact LongName match (for full paths)
+    def _build_model_lookup(self):
+        """Map LongName and Name to scene models in one pass over all_models"""
+        by_name = {}
+        by_long_name = {}
         for model in self.all_models:
-            if model.LongName == name:
-                return model
+            by_name.setdefault(model.Name, model)
+            by_long_name.setdefault(model.LongName, model)
 
-        # Then try Name match (for simple names)
-        for model in self.all_models:
-            if model.Name == name:
-                return model
+        # Exact LongName matches (full paths) take priority over simple names
+        by_name.update(by_long_name)
+        return by_name
 
-        return None
+    def _create_preset_dialog(self, title, accept_mode):
+        """Create a preset file dialog that is kept and reopened on later calls"""
+        dialog = QFileDialog(self, title)
+        dialog.setNameFilter("JSON Files (*.json)")
+        dialog.setAcceptMode(accept_mode)
+        dialog.setDefaultSuffix("json")
+        return dialog
 
     def on_export_preset(self):
         """Export preset to external file"""
@@ -1061,7 +1148,7 @@ class CharacterMapperDialog(QDialog):
 
         preset_file = self.preset_path / f"{preset_name}.json"
 
-        if not preset_file.exists():
+        if not self._preset_index.has(preset_name):
             QMessageBox.warning(
                 self,
                 "Preset Not Found",
@@ -1071,16 +1158,15 @@ class CharacterMapperDialog(QDialog):
 
         # Show file save dialog starting in presets directory
         default_path = str(self.preset_path / f"{preset_name}.json")
-        export_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Character Preset",
-            default_path,
-            "JSON Files (*.json)"
-        )
+        if self._export_dialog is None:
+            self._export_dialog = self._create_preset_dialog("Export Character Preset", QFileDialog.AcceptSave)
+        self._export_dialog.setDirectory(str(self.preset_path))
+        self._export_dialog.selectFile(default_path)
+        export_path = self._export_dialog.selectedFiles()[0] if self._export_dialog.exec_() else ""
 
         if export_path:
             try:
-                shutil.copy2(preset_file, export_path)
+                _fast_copy(preset_file, export_path)
                 QMessageBox.information(
                     self,
                     "Export Successful",
@@ -1095,29 +1181,29 @@ class CharacterMapperDialog(QDialog):
     def on_import_preset(self):
         """Import preset from external file"""
         # Show file open dialog starting in presets directory
-        import_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Import Character Preset",
-            str(self.preset_path),
-            "JSON Files (*.json)"
-        )
+        if self._import_dialog is None:
+            self._import_dialog = self._create_preset_dialog("Import Character Preset", QFileDialog.AcceptOpen)
+            self._import_dialog.setFileMode(QFileDialog.ExistingFile)
+        self._import_dialog.setDirectory(str(self.preset_path))
+        import_path = self._import_dialog.selectedFiles()[0] if self._import_dialog.exec_() else ""
 
         if import_path:
             try:
                 import_path = Path(import_path)
 
-                # Read the preset
-                with open(import_path, 'r') as f:
-                    preset_data = json.load(f)
+                # Read the preset once; the same bytes are parsed and copied
+                preset_bytes = import_path.read_bytes()
+                preset_data = json.loads(preset_bytes)
 
                 preset_name = preset_data.get("name", import_path.stem)
 
                 # Copy to presets directory (skip if already there)
                 dest_file = self.preset_path / f"{preset_name}.json"
                 if import_path.resolve() != dest_file.resolve():
-                    shutil.copy2(import_path, dest_file)
+                    dest_file.write_bytes(preset_bytes)
                 else:
                     print(f"[Character Mapper Qt] File already in presets directory, skipping copy")
+                self._preset_index.add(preset_name)
 
                 # Update preset name field
                 try:
@@ -1128,25 +1214,30 @@ class CharacterMapperDialog(QDialog):
                     print(f"[Character Mapper Qt] Warning: preset name field no longer accessible")
                     pass
 
-                # Load the preset
-                self.on_clear_mapping()
-
-                # Find models by name and map them
-                for slot_name, bone_name in preset_data.get("mappings", {}).items():
-                    if slot_name in self.bone_mappings:
-                        model = self._find_model_by_name(bone_name)
-                        if model:
-                            self.bone_mappings[slot_name] = model
-
-                            # Update display
-                            for i, (s_name, _) in enumerate(CHARACTER_SLOTS):
-                                if s_name == slot_name:
-                                    item = self.mappingList.item(i)
-                                    if item:
-                                        item.setText(f"{slot_name}: {model.Name}")
-                                    break
-                        else:
-                            print(f"[Character Mapper Qt WARNING] Model '{bone_name}' not found in scene")
+                # Re-importing the preset that is already applied would rebuild the same mapping
+                preset_hash = hashlib.blake2b(preset_bytes, digest_size=16).hexdigest()
+                if preset_hash == self._last_preset_hash:
+                    print(f"[Character Mapper Qt] Preset unchanged since last import, keeping current mapping")
+                else:
+                    # Load the preset
+                    self.on_clear_mapping()
+
+                    # Find models by name and map them
+                    model_lookup = self._build_model_lookup()
+                    for slot_name, bone_name in preset_data.get("mappings", {}).items():
+                        if slot_name in self.bone_mappings:
+                            model = model_lookup.get(bone_name)
+                            if model:
+                                self.bone_mappings[slot_name] = model
+
+                                # Update display
+                                item = self.mappingList.item(SLOT_INDEX[slot_name])
+                                if item:
+                                    item.setText(f"{slot_name}: {model.Name}")
+                            else:
+                                print(f"[Character Mapper Qt WARNING] Model '{bone_name}' not found in scene")
+
+                    self._last_preset_hash = preset_hash
 
                 QMessageBox.information(
                     self,
@@ -4,6 +4,7 @@ Create and manage constraints easily in MotionBuilder
 """
 
 from pathlib import Path
+import traceback
 
 try:
     from PySide2 import QtWidgets, QtCore, QtUiTools
@@ -20,7 +21,7 @@ except ImportError:
         QtWidgets = None
 
 from pyfbsdk import (
-    FBMessageBox, FBSystem, FBConstraintManager
+    FBMessageBox, FBSystem, FBConstraintManager, FBBeginChangeAllModels, FBEndChangeAllModels
 )
 from core.logger import logger
 from mobu.utils import get_all_models, SceneEventManager, refresh_list_widget
@@ -92,6 +93,18 @@ class ConstraintManagerDialog(QDialog):
         self.constraint_parents = []  # Parent objects for constraint
         self.constraint_children = []  # Child objects for constraint
         self._is_closing = False      # Flag to prevent callback execution during close
+        self._created_constraints = []  # Constraints made by the Active checkbox for the current setup
+        self._created_key = None      # (type, targets, parents) the created constraints were built for
+        self._scene_version = 0       # Bumped on scene mutations that affect the list
+        self._cached_version = None   # Scene version the list was last built for
+        self._constraint_manager = FBConstraintManager()  # Shared by every constraint creation
+        self._constraint_types = None  # Constraint type name -> TypeCreateConstraint index
+
+        # Coalesce bursts of scene/file events into a single list refresh
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.update_list_widget)
 
         # Load the UI file
         ui_path = Path(__file__).parent / "constraint_manager.ui"
@@ -170,7 +183,6 @@ class ConstraintManagerDialog(QDialog):
         except Exception as e:
             print(f"[Constraint Manager Qt] Error loading UI: {str(e)}")
             logger.error(f"Failed to load UI file: {str(e)}")
-            import traceback
             traceback.print_exc()
 
         # Populate scene objects AFTER UI is fully loaded
@@ -188,6 +200,9 @@ class ConstraintManagerDialog(QDialog):
         if hasattr(self, 'event_manager'):
             self.event_manager.unregister_all()
 
+        # Drop any refresh still pending from the last event burst
+        self._refresh_timer.stop()
+
         _constraint_manager_dialog = None
         _q_application_instance = None # Clear global QApplication reference
         event.accept()
@@ -239,11 +254,14 @@ class ConstraintManagerDialog(QDialog):
             return
 
         print(f"[Constraint Manager Qt] File event detected, refreshing scene list")
-        self.update_list_widget()
         # Clear selections on file operations
         self.selected_objects = []
         self.constraint_parents = []
         self.constraint_children = []
+        self._created_constraints = []
+        self._created_key = None
+        self._scene_version += 1
+        self._refresh_timer.start()
 
     def on_scene_change(self, pCaller, pEvent):
         """Callback for scene changes (object add/delete)"""
@@ -266,12 +284,19 @@ class ConstraintManagerDialog(QDialog):
             return
 
         print(f"[Constraint Manager Qt] Scene change detected, refreshing list")
-        self.update_list_widget()
+        self._scene_version += 1
+        # Restarting the timer pushes the refresh back until the burst settles
+        self._refresh_timer.start()
 
     def update_list_widget(self):
         """Update the selection list with current scene objects"""
         print("[Constraint Manager Qt] update_list_widget() called")
 
+        # Nothing has changed since the last rebuild, keep the current list
+        if self._cached_version == self._scene_version:
+            print("[Constraint Manager Qt] Scene unchanged, skipping refresh")
+            return
+
         # Get all models from the scene
         self.all_scene_objects = get_all_models()
 
@@ -284,10 +309,12 @@ class ConstraintManagerDialog(QDialog):
             list_widget_name="selectionList",
             models=self.all_scene_objects,
             selected_objects=self.selected_objects,
-            tool_name="Constraint Manager Qt"
+            tool_name="Constraint Manager Qt",
+            list_widget=getattr(self, 'selectionList', None)
         )
 
         if success:
+            self._cached_version = self._scene_version
             print(f"[Constraint Manager Qt] List updated with {len(self.all_scene_objects)} objects")
             print(f"[Constraint Manager Qt] UI refresh complete")
         else:
@@ -296,6 +323,8 @@ class ConstraintManagerDialog(QDialog):
     def on_refresh_clicked(self):
         """Handle refresh button click"""
         print("[Constraint Manager Qt] ===== REFRESH BUTTON CLICKED =====")
+        # Manual refresh always rebuilds
+        self._scene_version += 1
         self.update_list_widget()
         print("[Constraint Manager Qt] ===== REFRESH COMPLETE =====")
 
@@ -310,46 +339,58 @@ class ConstraintManagerDialog(QDialog):
         # Get the model name from the clicked item
         model_name = item.text()
 
-        # Find the corresponding model
+        # List rows are built in all_scene_objects order, so the row is the index.
+        # This also resolves duplicate names to the row that was actually clicked.
+        row = self.selectionList.row(item)
+        scene_objects = self.all_scene_objects
         model = None
-        for obj in self.all_scene_objects:
-            if obj.Name == model_name:
-                model = obj
-                break
+        if 0 <= row < len(scene_objects):
+            model = scene_objects[row]
 
-        if not model:
+        if not model or model.Name != model_name:
             print(f"[Constraint Manager Qt] WARNING: Model '{model_name}' not found")
             return
 
+        # model_name is verified above; reuse it rather than reading model.Name again
+        selected = self.selected_objects
+
         # Check if Ctrl or Shift is pressed for multi-selection
         modifiers = QApplication.keyboardModifiers()
 
         if modifiers == Qt.ControlModifier:
             # Ctrl: Toggle selection (add/remove from selection)
-            if model in self.selected_objects:
-                self.selected_objects.remove(model)
+            if model in selected:
+                selected.remove(model)
                 model.Selected = False
-                print(f"[Constraint Manager Qt] Removed from selection: {model.Name}")
+                print(f"[Constraint Manager Qt] Removed from selection: {model_name}")
             else:
-                self.selected_objects.append(model)
+                selected.append(model)
                 model.Selected = True
-                print(f"[Constraint Manager Qt] Added to selection: {model.Name}")
+                print(f"[Constraint Manager Qt] Added to selection: {model_name}")
         else:
             # No modifier: Clear selection and select only this object
-            # Clear all selections first
-            for obj in self.selected_objects:
-                obj.Selected = False
+            # Batch the deselects and new select into one scene change
+            FBBeginChangeAllModels()
+            try:
+                for obj in selected:
+                    obj.Selected = False
+                model.Selected = True
+            finally:
+                FBEndChangeAllModels()
 
-            self.selected_objects = [model]
-            model.Selected = True
-            print(f"[Constraint Manager Qt] Selected: {model.Name}")
+            selected = self.selected_objects = [model]
+            print(f"[Constraint Manager Qt] Selected: {model_name}")
 
-        print(f"[Constraint Manager Qt] Selection order: {[obj.Name for obj in self.selected_objects]}")
+        print(f"[Constraint Manager Qt] Selection order: {[obj.Name for obj in selected]}")
 
     def on_clear_selection(self):
         """Clear all selections in viewport"""
-        for obj in self.selected_objects:
-            obj.Selected = False
+        FBBeginChangeAllModels()
+        try:
+            for obj in self.selected_objects:
+                obj.Selected = False
+        finally:
+            FBEndChangeAllModels()
 
         self.selected_objects = []
         print("[Constraint Manager Qt] Cleared all selections")
@@ -390,6 +431,11 @@ class ConstraintManagerDialog(QDialog):
         """Toggle constraint active state or create new constraint"""
         is_active = (state == 2)  # Qt.Checked = 2
 
+        # Unchecking only deactivates the constraints already created, it never builds new ones
+        if not is_active:
+            self._set_created_constraints_active(False)
+            return
+
         if not self._validate_constraint_setup():
             # Reset checkbox if validation fails
             self.activeCheckbox.setChecked(False)
@@ -416,12 +462,20 @@ class ConstraintManagerDialog(QDialog):
             self._create_relation_constraint()
             return
 
+        # Use children if set, otherwise fall back to selected objects
+        targets = self.constraint_children if self.constraint_children else self.selected_objects
+
+        # Re-checking with an unchanged setup re-activates the existing constraints
+        created_key = (constraint_type, tuple(targets), tuple(self.constraint_parents))
+        if created_key == self._created_key and self._set_created_constraints_active(True):
+            return
+
         try:
-            # Use children if set, otherwise fall back to selected objects
-            targets = self.constraint_children if self.constraint_children else self.selected_objects
+            self._created_constraints = []
+            self._created_key = created_key
 
             for target in targets:
-                constraint = FBConstraintManager().TypeCreateConstraint(mb_type)
+                constraint = self._create_constraint(mb_type)
                 if constraint:
                     constraint.Name = f"{constraint_type}_{target.Name}"
                     constraint.ReferenceAdd(0, target)
@@ -430,11 +484,11 @@ class ConstraintManagerDialog(QDialog):
                         constraint.ReferenceAdd(1, parent)
 
                     constraint.Weight = 100.0
-                    constraint.Active = is_active
-                    if is_active:
-                        constraint.Snap()
+                    constraint.Active = True
+                    constraint.Snap()
+                    self._created_constraints.append(constraint)
 
-                    print(f"[Constraint Manager Qt] Created {constraint_type} for {target.Name} (Active={is_active})")
+                    print(f"[Constraint Manager Qt] Created {constraint_type} for {target.Name} (Active=True)")
 
             QMessageBox.information(
                 self,
@@ -447,6 +501,44 @@ class ConstraintManagerDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to create constraint:\n{str(e)}")
             self.activeCheckbox.setChecked(False)
 
+    def _create_constraint(self, type_name):
+        """Create a constraint by type name through the shared FBConstraintManager"""
+        manager = self._constraint_manager
+
+        # TypeCreateConstraint takes the type's index; resolve the names once
+        if self._constraint_types is None:
+            self._constraint_types = {
+                manager.TypeGetName(i): i for i in range(manager.TypeGetCount())
+            }
+
+        index = self._constraint_types.get(type_name)
+        if index is None:
+            print(f"[Constraint Manager Qt] Unknown constraint type: {type_name}")
+            return None
+        return manager.TypeCreateConstraint(index)
+
+    def _set_created_constraints_active(self, active):
+        """Toggle the constraints created for the current setup
+
+        Returns:
+            bool: True if at least one created constraint still exists
+        """
+        alive = []
+        for constraint in self._created_constraints:
+            try:
+                constraint.Active = active
+                if active:
+                    constraint.Snap()
+            except Exception:
+                # Deleted from the scene since it was created
+                continue
+            alive.append(constraint)
+
+        self._created_constraints = alive
+        if alive:
+            print(f"[Constraint Manager Qt] Set {len(alive)} constraint(s) Active={active}")
+        return bool(alive)
+
     def _create_relation_constraint(self):
         """Create relation constraint"""
         QMessageBox.information(
@@ -458,7 +550,7 @@ class ConstraintManagerDialog(QDialog):
         )
 
         try:
-            constraint = FBConstraintManager().TypeCreateConstraint("Relation")
+            constraint = self._create_constraint("Relation")
             if constraint:
                 constraint.Name = "Relation_Custom"
                 constraint.Active = True
@@ -482,15 +574,18 @@ class ConstraintManagerDialog(QDialog):
             return
 
         try:
+            # Walk the scene constraints once and test constrained objects
+            # against the selection, instead of rescanning per selected model
+            selected_set = set(self.selected_objects)
             snapped_count = 0
-            for model in self.selected_objects:
-                for constraint in FBSystem().Scene.Constraints:
-                    if constraint.Active:
-                        for i in range(constraint.ReferenceGroupGetCount(0)):
-                            if constraint.ReferenceGet(0, i) == model:
-                                constraint.Snap()
-                                snapped_count += 1
-                                break
+            for constraint in FBSystem().Scene.Constraints:
+                if not constraint.Active:
+                    continue
+                for i in range(constraint.ReferenceGroupGetCount(0)):
+                    if constraint.ReferenceGet(0, i) in selected_set:
+                        constraint.Snap()
+                        snapped_count += 1
+                        break
 
             if snapped_count > 0:
                 QMessageBox.information(self, "Success", f"Snapped {snapped_count} constraint(s)")
@@ -4,17 +4,72 @@ Generates random markers and nulls for testing constraints and other tools
 """
 
 import random
-from pyfbsdk import (
-    FBModelMarker, FBModelNull, FBVector3d, FBColor, FBSystem, FBMessageBox,
-    FBMarkerLook
-)
+import traceback
+
 from core.logger import logger
 
 TOOL_NAME = "Random Objects Generator"
 
+# Marker looks to pick from, built on first use (pyfbsdk is imported lazily)
+_MARKER_LOOKS = None
+
+
+def _marker_looks():
+    """Return the available marker looks, resolving them from pyfbsdk once"""
+    global _MARKER_LOOKS
+
+    if _MARKER_LOOKS is None:
+        from pyfbsdk import FBMarkerLook
+        _MARKER_LOOKS = (
+            FBMarkerLook.kFBMarkerLookCube,
+            FBMarkerLook.kFBMarkerLookHardCross,
+            FBMarkerLook.kFBMarkerLookLightCross,
+            FBMarkerLook.kFBMarkerLookSphere
+        )
+    return _MARKER_LOOKS
+
+
+def _random_object_params(num_objects, position_range, num_looks):
+    """Generate every object's random parameters up front
+
+    Uses NumPy when available, otherwise falls back to the random module.
+
+    Returns:
+        tuple: (transforms, is_marker, looks) - one (x, y, z, rx, ry, rz, r, g, b)
+        float row, one bool and one marker look index per object.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    low = [-position_range, 0, -position_range, 0, 0, 0, 0.3, 0.3, 0.3]
+    high = [position_range, position_range * 1.5, position_range,  # Keep above ground
+            360, 360, 360, 1.0, 1.0, 1.0]
+
+    if np is not None:
+        rng = np.random.default_rng()
+        transforms = rng.uniform(low, high, size=(num_objects, len(low))).tolist()
+        is_marker = rng.integers(0, 2, size=num_objects).astype(bool).tolist()
+        looks = rng.integers(0, num_looks, size=num_objects).tolist()
+        return transforms, is_marker, looks
+
+    uniform = random.uniform
+    bounds = list(zip(low, high))
+    transforms = [[uniform(lo, hi) for lo, hi in bounds] for _ in range(num_objects)]
+    is_marker = [random.random() < 0.5 for _ in range(num_objects)]
+    looks = [random.randrange(num_looks) for _ in range(num_objects)]
+    return transforms, is_marker, looks
+
 
 def execute(control, event):
     """Generate random markers and nulls for testing"""
+    # Imported on use so loading the tool menu doesn't bind pyfbsdk symbols
+    from pyfbsdk import (
+        FBModelMarker, FBModelNull, FBVector3d, FBColor, FBMessageBox,
+        FBBeginChangeAllModels, FBEndChangeAllModels
+    )
+
     try:
         # Configuration
         num_objects = 10
@@ -23,60 +78,60 @@ def execute(control, event):
         null_size = 20.0
 
         created_objects = []
+        log_lines = []  # Per-object details, printed in one go after creation
 
         print(f"[Random Objects] Generating {num_objects} random objects...")
 
         # Available marker looks
-        marker_looks = [
-            FBMarkerLook.kFBMarkerLookCube,
-            FBMarkerLook.kFBMarkerLookHardCross,
-            FBMarkerLook.kFBMarkerLookLightCross,
-            FBMarkerLook.kFBMarkerLookSphere
-        ]
-
-        for i in range(num_objects):
-            # Randomly choose object type (markers or nulls)
-            obj_type = random.choice(['marker', 'null'])
-
-            # Create object based on type
-            if obj_type == 'marker':
-                obj = FBModelMarker(f"DebugMarker_{i+1}")
-                obj.Size = marker_size
-                obj.Look = random.choice(marker_looks)
-            else:  # null
-                obj = FBModelNull(f"DebugNull_{i+1}")
-                obj.Size = null_size
-
-            # Set random position
-            x = random.uniform(-position_range, position_range)
-            y = random.uniform(0, position_range * 1.5)  # Keep above ground
-            z = random.uniform(-position_range, position_range)
-            obj.Translation = FBVector3d(x, y, z)
-
-            # Set random rotation
-            rx = random.uniform(0, 360)
-            ry = random.uniform(0, 360)
-            rz = random.uniform(0, 360)
-            obj.Rotation = FBVector3d(rx, ry, rz)
-
-            # Random color
-            r = random.uniform(0.3, 1.0)
-            g = random.uniform(0.3, 1.0)
-            b = random.uniform(0.3, 1.0)
-            obj.Color = FBColor(r, g, b)
-
-            obj.Show = True
-            created_objects.append(obj)
-
-            print(f"[Random Objects]   Created {obj_type}: {obj.Name} at ({x:.1f}, {y:.1f}, {z:.1f})")
-
-        # Create a null to group them
+        marker_looks = _marker_looks()
+
+        transforms, is_marker, looks = _random_object_params(
+            num_objects, position_range, len(marker_looks)
+        )
+
+        # Create the group null first so everything can be parented in one pass
         group_null = FBModelNull("DebugObjects_Group")
         group_null.Show = True
 
-        for obj in created_objects:
-            obj.Parent = group_null
-
+        # Batch model changes so the scene is notified once, not per property
+        FBBeginChangeAllModels()
+        try:
+            for i in range(num_objects):
+                x, y, z, rx, ry, rz, r, g, b = transforms[i]
+
+                # Create object based on the random type (markers or nulls)
+                if is_marker[i]:
+                    obj_type = 'marker'
+                    obj = FBModelMarker(f"DebugMarker_{i+1}")
+                    obj.Size = marker_size
+                    obj.Look = marker_looks[looks[i]]
+                else:  # null
+                    obj_type = 'null'
+                    obj = FBModelNull(f"DebugNull_{i+1}")
+                    obj.Size = null_size
+
+                # Set random position
+                obj.Translation = FBVector3d(x, y, z)
+
+                # Set random rotation
+                obj.Rotation = FBVector3d(rx, ry, rz)
+
+                # Random color
+                obj.Color = FBColor(r, g, b)
+
+                created_objects.append(obj)
+
+                log_lines.append(f"[Random Objects]   Created {obj_type}: {obj.Name} at ({x:.1f}, {y:.1f}, {z:.1f})")
+
+            # Show and parent in a second pass once every object exists
+            for obj in created_objects:
+                obj.Show = True
+                obj.Parent = group_null
+        finally:
+            FBEndChangeAllModels()
+
+        # One console write instead of one per object
+        print("\n".join(log_lines))
         print(f"[Random Objects] Created {len(created_objects)} objects")
         logger.info(f"Generated {len(created_objects)} random debug objects")
 
@@ -93,7 +148,6 @@ def execute(control, event):
         error_msg = f"Failed to generate random objects: {str(e)}"
         print(f"[Random Objects ERROR] {error_msg}")
         logger.error(error_msg)
-        import traceback
         traceback.print_exc()
 
         FBMessageBox(
@@ -4,44 +4,199 @@ Configure P4 connection and export paths using Qt Designer UI
 """
 
 from pathlib import Path
+import importlib
 import subprocess
+import threading
+import time
 import os
 
 try:
     from PySide2 import QtWidgets, QtCore, QtUiTools
     from PySide2.QtWidgets import QDialog, QFileDialog, QMessageBox, QApplication
-    from PySide2.QtCore import QFile, Qt
+    from PySide2.QtCore import Qt
 except ImportError:
     try:
         from PySide import QtGui as QtWidgets
         from PySide import QtCore, QtUiTools
         from PySide.QtGui import QDialog, QFileDialog, QMessageBox, QApplication
-        from PySide.QtCore import QFile, Qt
+        from PySide.QtCore import Qt
     except ImportError:
         print("[Settings Qt] ERROR: Neither PySide2 nor PySide found")
         QtWidgets = None
 
 from core.config import config
 from core.logger import logger
+from mobu.utils import get_ui_bytes
 
 TOOL_NAME = "xMobu Settings"
 
 # Global reference to prevent garbage collection
 _settings_dialog = None
 
+# MotionBuilder main window found by get_mobu_main_window
+_MOBU_MAIN = None
+
+# Widgets from settings.ui that the dialog binds as attributes
+_WIDGET_NAMES = (
+    "p4ServerEdit", "p4UserEdit", "p4WorkspaceList", "testP4Button", "p4StatusLabel",
+    "fbxPathEdit", "browseFbxButton",
+    "charRigsPathEdit", "browseCharRigsButton", "charAnimsPathEdit", "browseCharAnimsButton",
+    "saveButton", "resetButton", "applyCloseButton",
+)
+
+# Successful workspace queries: (server, user) -> (time.monotonic() stamp, workspaces)
+_WORKSPACE_CACHE = {}
+_WORKSPACE_TTL = 60.0  # Seconds before a cached workspace list is queried again
+
+
+def _load_form_class():
+    """Return the precompiled Ui_SettingsWidget class, or None to use QUiLoader
+
+    settings_ui.py is generated with 'pyside2-uic settings.ui -o settings_ui.py'.
+    It is skipped when missing or older than settings.ui so an edited .ui is
+    never shadowed by a stale build.
+    """
+    here = Path(__file__).parent
+    try:
+        form_mtime = (here / "settings_ui.py").stat().st_mtime
+        if form_mtime < (here / "settings.ui").stat().st_mtime:
+            print("[Settings Qt] settings_ui.py is older than settings.ui, using QUiLoader")
+            return None
+        from . import settings_ui
+        # The import is served from sys.modules after Reload xMobu; re-execute
+        # the module when settings_ui.py was regenerated since it was loaded
+        if getattr(settings_ui, "_source_mtime", form_mtime) != form_mtime:
+            settings_ui = importlib.reload(settings_ui)
+        settings_ui._source_mtime = form_mtime
+        return settings_ui.Ui_SettingsWidget
+    except (OSError, ImportError, AttributeError):
+        return None
+
+
+_UI_FORM_CLASS = _load_form_class() if QtWidgets else None
+
+
+def _query_workspaces(server, user):
+    """Run 'p4 clients' for a user and return (workspaces, error_msg)
+
+    Raises FileNotFoundError if p4 is not installed and
+    subprocess.TimeoutExpired if the server does not answer.
+    """
+    # Query P4 for workspaces; -p/-u already override P4PORT/P4USER, so the
+    # child simply inherits the current environment (tickets, P4CONFIG).
+    # -ztag gives one "... field value" line per field instead of the
+    # human-readable summary, so descriptions and dates can't skew the parse
+    args = ['p4', '-ztag', '-p', server, '-u', user, 'clients', '-u', user]
+    timed_out = threading.Event()
+
+    # Read raw bytes: only the workspace token of each matching line gets decoded
+    with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        def _kill():
+            timed_out.set()
+            proc.kill()
+
+        # Killing p4 closes its stdout, which ends the read loop below
+        timer = threading.Timer(10, _kill)
+        timer.start()
+        try:
+            # Parse lines as p4 writes them instead of buffering the whole output.
+            # Each workspace record starts with "... client <name>"; the other
+            # fields (Update, Owner, Root, Description...) are skipped
+            workspaces = []
+            add_workspace = workspaces.append
+            for line in proc.stdout:
+                if line[:11] == b'... client ':
+                    workspace = line[11:].strip()
+                    if workspace:
+                        add_workspace(workspace.decode('utf-8', 'replace'))
+            stderr = proc.stderr.read().decode('utf-8', 'replace')
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(args, 10)
+
+    if returncode != 0:
+        return [], stderr.strip() or "Unknown error"
+    return workspaces, ""
+
+
+def _query_info(server, user, workspace):
+    """Run 'p4 info' for a server/user/workspace and return (info_lines, error_msg)
+
+    Raises the same exceptions as _query_workspaces.
+    """
+    result = subprocess.run(
+        ['p4', '-p', server, '-u', user, '-c', workspace, 'info'],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+
+    if result.returncode != 0:
+        return [], result.stderr.strip() if result.stderr else "Unknown error"
+    return result.stdout.splitlines(), ""
+
+
+class _P4Signals(QtCore.QObject):
+    """Signals for _P4Worker (QRunnable is not a QObject)"""
+    # request id, result lines, status ('ok', 'not_found', 'timeout', 'error'), error message
+    finished = QtCore.Signal(int, list, str, str)
+
+
+class _P4Worker(QtCore.QRunnable):
+    """Runs a p4 query on a thread pool thread so the dialog stays responsive"""
+
+    def __init__(self, request_id, query, args, signals):
+        super(_P4Worker, self).__init__()
+        self.request_id = request_id
+        self.query = query
+        self.args = args
+        self.signals = signals
+
+    def run(self):
+        lines = []
+        try:
+            lines, error_msg = self.query(*self.args)
+            status = "error" if error_msg else "ok"
+        except FileNotFoundError:
+            status, error_msg = "not_found", ""
+        except subprocess.TimeoutExpired:
+            status, error_msg = "timeout", ""
+        except Exception as e:
+            status, error_msg = "error", str(e)
+
+        try:
+            self.signals.finished.emit(self.request_id, lines, status, error_msg)
+        except RuntimeError:
+            # Dialog was destroyed while the query was running
+            pass
+
 
 def get_mobu_main_window():
     """Get MotionBuilder's main window to use as parent"""
+    global _MOBU_MAIN
+
+    # Reuse the window found last time while it is still alive
+    if _MOBU_MAIN is not None:
+        try:
+            _MOBU_MAIN.objectName()
+            return _MOBU_MAIN
+        except RuntimeError:
+            _MOBU_MAIN = None
+
     try:
         app = QApplication.instance()
         if app:
             # Try to find MotionBuilder main window
-            for widget in app.topLevelWidgets():
+            widgets = app.topLevelWidgets()
+            for widget in widgets:
                 if widget.objectName() == "MotionBuilder" or "MotionBuilder" in widget.windowTitle():
                     print(f"[Settings Qt] Found parent window: {widget.windowTitle()}")
+                    _MOBU_MAIN = widget
                     return widget
             # Fallback: return first top-level widget
-            widgets = app.topLevelWidgets()
             if widgets:
                 print(f"[Settings Qt] Using first top-level widget as parent: {widgets[0].windowTitle()}")
                 return widgets[0]
@@ -68,6 +223,22 @@ def execute(control, event):
     _settings_dialog.show()
 
 
+def destroy_dialog():
+    """Delete the persistent settings dialog (closing it only hides it)"""
+    global _settings_dialog
+
+    if _settings_dialog is None:
+        return
+
+    try:
+        _settings_dialog._p4_debounce.stop()
+        _settings_dialog.deleteLater()
+    except RuntimeError:
+        pass  # Already deleted on the C++ side
+    _settings_dialog = None
+    print("[Settings Qt] Settings dialog destroyed")
+
+
 class SettingsDialog(QDialog):
     """Settings dialog using Qt Designer UI"""
 
@@ -81,6 +252,25 @@ class SettingsDialog(QDialog):
             self.setWindowFlags(Qt.Window | Qt.WindowCloseButtonHint | Qt.WindowTitleHint)
             print("[Settings Qt] WARNING: No parent found, creating as standalone window")
         self.workspaces = []
+        self._p4_request_id = 0  # Only the latest workspace query may update the list
+        self._p4_request_key = None  # (server, user) of the latest workspace query, unless it failed
+        self._pending_workspace = ""  # Saved workspace to select once the query returns
+        self._workspace_index = {}  # Workspace name -> row in p4WorkspaceList
+        self._reload_on_show = False  # Set when hidden by close; the next show re-reads config
+
+        # Query results come back from the thread pool through these; queued
+        # explicitly so the slots always run on the GUI thread's event loop
+        self._p4_signals = _P4Signals(self)
+        self._p4_signals.finished.connect(self._on_workspaces_loaded, Qt.QueuedConnection)
+        self._p4_test_signals = _P4Signals(self)
+        self._p4_test_signals.finished.connect(self._on_p4_test_finished, Qt.QueuedConnection)
+        self._p4_test_args = None  # (server, user, workspace) of the running connection test
+
+        # Coalesce back-to-back server/user commits (Enter then focus out) into one query
+        self._p4_debounce = QtCore.QTimer(self)
+        self._p4_debounce.setSingleShot(True)
+        self._p4_debounce.setInterval(400)
+        self._p4_debounce.timeout.connect(self.load_workspaces)
 
         # Load the UI file
         ui_path = Path(__file__).parent / "settings.ui"
@@ -95,23 +285,33 @@ class SettingsDialog(QDialog):
             self.setMinimumSize(480, 340)
             self.setMaximumSize(600, 450)
 
-            loader = QtUiTools.QUiLoader()
-            file = QFile(ui_file)
+            form = None
+            if _UI_FORM_CLASS is not None:
+                # Precompiled form: no XML parsing, widgets are plain attributes
+                ui_widget = QtWidgets.QWidget(self)
+                form = _UI_FORM_CLASS()
+                form.setupUi(ui_widget)
+                print("[Settings Qt] Built UI from precompiled settings_ui")
+            else:
+                ui_bytes = get_ui_bytes(ui_file)
 
-            if not file.exists():
-                print(f"[Settings Qt] UI file not found: {ui_file}")
-                print(f"[Settings Qt] Searched path: {ui_file}")
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    f"UI file not found:\n{ui_file}"
-                )
-                return
+                if ui_bytes is None:
+                    print(f"[Settings Qt] UI file not found: {ui_file}")
+                    print(f"[Settings Qt] Searched path: {ui_file}")
+                    QMessageBox.critical(
+                        self,
+                        "Error",
+                        f"UI file not found:\n{ui_file}"
+                    )
+                    return
 
-            file.open(QFile.ReadOnly)
-            print(f"[Settings Qt] Loading UI from: {ui_file}")
-            ui_widget = loader.load(file, self)
-            file.close()
+                loader = QtUiTools.QUiLoader()
+                buffer = QtCore.QBuffer()
+                buffer.setData(QtCore.QByteArray(ui_bytes))
+                buffer.open(QtCore.QIODevice.ReadOnly)
+                print(f"[Settings Qt] Loading UI from: {ui_file}")
+                ui_widget = loader.load(buffer, self)
+                buffer.close()
 
             if ui_widget:
                 print(f"[Settings Qt] UI widget loaded, type: {type(ui_widget)}")
@@ -122,17 +322,13 @@ class SettingsDialog(QDialog):
                 layout.addWidget(ui_widget)
                 self.setLayout(layout)
 
-                # Store references to UI elements using findChild
-                self.p4ServerEdit = ui_widget.findChild(QtWidgets.QLineEdit, "p4ServerEdit")
-                self.p4UserEdit = ui_widget.findChild(QtWidgets.QLineEdit, "p4UserEdit")
-                self.p4WorkspaceList = ui_widget.findChild(QtWidgets.QListWidget, "p4WorkspaceList")
-                self.testP4Button = ui_widget.findChild(QtWidgets.QPushButton, "testP4Button")
-                self.p4StatusLabel = ui_widget.findChild(QtWidgets.QLabel, "p4StatusLabel")
-                self.fbxPathEdit = ui_widget.findChild(QtWidgets.QLineEdit, "fbxPathEdit")
-                self.browseFbxButton = ui_widget.findChild(QtWidgets.QPushButton, "browseFbxButton")
-                self.saveButton = ui_widget.findChild(QtWidgets.QPushButton, "saveButton")
-                self.resetButton = ui_widget.findChild(QtWidgets.QPushButton, "resetButton")
-                self.applyCloseButton = ui_widget.findChild(QtWidgets.QPushButton, "applyCloseButton")
+                # Store references to UI elements, from the form or one pass over the children
+                if form is not None:
+                    by_name = form.__dict__
+                else:
+                    by_name = {child.objectName(): child for child in ui_widget.findChildren(QtCore.QObject)}
+                for name in _WIDGET_NAMES:
+                    setattr(self, name, by_name.get(name))
 
                 # Debug - print what we found
                 print(f"[Settings Qt] Found p4ServerEdit: {self.p4ServerEdit}")
@@ -160,10 +356,19 @@ class SettingsDialog(QDialog):
             traceback.print_exc()
 
     def closeEvent(self, event):
-        """Handle dialog close event"""
-        global _settings_dialog
-        _settings_dialog = None
-        event.accept()
+        """Handle dialog close event - hide and keep the dialog for the next open"""
+        self._p4_debounce.stop()
+        self._reload_on_show = True
+        self.hide()
+        event.ignore()
+
+    def showEvent(self, event):
+        """Handle dialog show event - drop unsaved edits from before the last close"""
+        super(SettingsDialog, self).showEvent(event)
+
+        if self._reload_on_show:
+            self._reload_on_show = False
+            self.load_settings()
 
     def connect_signals(self):
         """Connect UI signals to slots"""
@@ -171,9 +376,9 @@ class SettingsDialog(QDialog):
             print("[Settings Qt] WARNING: Widgets not found, cannot connect signals")
             return
 
-        # P4 fields - auto-load workspaces
-        self.p4ServerEdit.textChanged.connect(self.on_p4_credentials_changed)
-        self.p4UserEdit.textChanged.connect(self.on_p4_credentials_changed)
+        # P4 fields - auto-load workspaces once an edit is committed (Enter or focus out)
+        self.p4ServerEdit.editingFinished.connect(self.on_p4_credentials_changed)
+        self.p4UserEdit.editingFinished.connect(self.on_p4_credentials_changed)
 
         # Buttons
         self.testP4Button.clicked.connect(self.on_test_p4_connection)
@@ -192,41 +397,42 @@ class SettingsDialog(QDialog):
             print("[Settings Qt] WARNING: Widgets not found, cannot load settings")
             return
 
+        # Resolve each config section once instead of walking the dotted path per key
+        perforce = config.get('perforce') or {}
+        export = config.get('export') or {}
+
         # Load P4 settings
-        self.p4ServerEdit.setText(config.get('perforce.server', ''))
-        self.p4UserEdit.setText(config.get('perforce.user', ''))
+        self.p4ServerEdit.setText(perforce.get('server', ''))
+        self.p4UserEdit.setText(perforce.get('user', ''))
 
-        saved_workspace = config.get('perforce.workspace', '')
+        saved_workspace = perforce.get('workspace', '')
 
         # Load export settings
-        self.fbxPathEdit.setText(config.get('export.fbx_path', ''))
-        self.charRigsPathEdit.setText(config.get('export.character_rigs_path', ''))
-        self.charAnimsPathEdit.setText(config.get('export.character_animations_path', ''))
+        self.fbxPathEdit.setText(export.get('fbx_path', ''))
+        self.charRigsPathEdit.setText(export.get('character_rigs_path', ''))
+        self.charAnimsPathEdit.setText(export.get('character_animations_path', ''))
 
         # Try to load workspaces if server and user are set
         if self.p4ServerEdit.text() and self.p4UserEdit.text():
+            # The saved workspace is selected once the query returns
+            self._pending_workspace = saved_workspace
             self.load_workspaces()
-            # Select the saved workspace if it exists
-            if saved_workspace:
-                items = self.p4WorkspaceList.findItems(saved_workspace, QtCore.Qt.MatchContains)
-                if items:
-                    self.p4WorkspaceList.setCurrentItem(items[0])
 
         print("[Settings Qt] Loaded settings from config")
 
     def on_p4_credentials_changed(self):
         """Called when server or user fields change"""
-        server = self.p4ServerEdit.text()
-        user = self.p4UserEdit.text()
-
-        if server and user:
-            print(f"[Settings Qt] P4 credentials changed, loading workspaces...")
-            self.load_workspaces()
+        key = (self.p4ServerEdit.text().strip(), self.p4UserEdit.text().strip())
+        if not all(key) or key == self._p4_request_key:
+            # Nothing to query, or the edit landed back on the last queried pair
+            self._p4_debounce.stop()
+            return
+        self._p4_debounce.start()
 
     def load_workspaces(self):
-        """Query P4 for available workspaces"""
-        server = self.p4ServerEdit.text()
-        user = self.p4UserEdit.text()
+        """Query P4 for available workspaces on a worker thread"""
+        server = self.p4ServerEdit.text().strip()
+        user = self.p4UserEdit.text().strip()
 
         if not server or not user:
             return
@@ -234,49 +440,35 @@ class SettingsDialog(QDialog):
         # Clear existing list
         self.p4WorkspaceList.clear()
 
+        # A newer query supersedes any still in flight
+        self._p4_request_id += 1
+        self._p4_request_key = (server, user)
+
+        # Reuse a recent result for the same server/user instead of spawning p4
+        entry = _WORKSPACE_CACHE.get(self._p4_request_key)
+        if entry and time.monotonic() - entry[0] < _WORKSPACE_TTL:
+            print(f"[Settings Qt] Using cached workspaces for {user}@{server}")
+            self._populate_workspaces(entry[1])
+            return
+
         print(f"[Settings Qt] Querying workspaces for {user}@{server}...")
-        self.p4StatusLabel.setText("Status: Loading workspaces...")
+        self._set_status("Status: Loading workspaces...")
+        worker = _P4Worker(self._p4_request_id, _query_workspaces, (server, user), self._p4_signals)
+        QtCore.QThreadPool.globalInstance().start(worker)
 
-        try:
-            # Set P4 environment
-            env = os.environ.copy()
-            env['P4PORT'] = server
-            env['P4USER'] = user
-
-            # Query P4 for workspaces
-            result = subprocess.run(
-                ['p4', '-p', server, '-u', user, 'clients', '-u', user],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                env=env
-            )
+    def _on_workspaces_loaded(self, request_id, workspaces, status, error_msg):
+        """Populate the workspace list with a finished query (GUI thread)"""
+        if request_id != self._p4_request_id:
+            return
 
-            if result.returncode == 0:
-                workspaces = []
-                for line in result.stdout.strip().split('\n'):
-                    if line.startswith('Client '):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            workspaces.append(parts[1])
-
-                if workspaces:
-                    self.workspaces = workspaces
-                    self.p4WorkspaceList.addItems(workspaces)
-                    self.p4StatusLabel.setText(f"Status: Found {len(workspaces)} workspace(s)")
-                    print(f"[Settings Qt] Found {len(workspaces)} workspaces")
-                else:
-                    self.p4WorkspaceList.addItem("(No workspaces found)")
-                    self.p4StatusLabel.setText("Status: No workspaces found")
-            else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                self.p4WorkspaceList.addItem("(Error loading workspaces)")
-                self.p4StatusLabel.setText(f"Status: Error - {error_msg[:30]}...")
-                logger.error(f"P4 query failed: {error_msg}")
+        if status == "ok":
+            _WORKSPACE_CACHE[self._p4_request_key] = (time.monotonic(), workspaces)
+            self._populate_workspaces(workspaces)
+            return
 
-        except FileNotFoundError:
+        if status == "not_found":
             self.p4WorkspaceList.addItem("(P4 command not found)")
-            self.p4StatusLabel.setText("Status: P4 CLI not installed")
+            self._set_status("Status: P4 CLI not installed")
             print("[Settings Qt] P4 command-line tool not found")
             QMessageBox.warning(
                 self,
@@ -285,19 +477,58 @@ class SettingsDialog(QDialog):
                 "Please install P4 CLI and ensure it's in your PATH."
             )
 
-        except subprocess.TimeoutExpired:
+        elif status == "timeout":
             self.p4WorkspaceList.addItem("(Connection timeout)")
-            self.p4StatusLabel.setText("Status: Connection timeout")
+            self._set_status("Status: Connection timeout")
 
-        except Exception as e:
+        else:
             self.p4WorkspaceList.addItem("(Error loading workspaces)")
-            self.p4StatusLabel.setText(f"Status: Error - {str(e)[:30]}...")
-            logger.error(f"Failed to load workspaces: {str(e)}")
+            self._set_status(f"Status: Error - {error_msg[:30]}...")
+            logger.error(f"P4 query failed: {error_msg}")
+
+        # Only a successful query counts as done; committing the same pair retries
+        self._p4_request_key = None
+        self._pending_workspace = ""
+
+    def _set_status(self, text):
+        """Show a P4 status message, skipping the repaint when it is unchanged"""
+        if self.p4StatusLabel.text() != text:
+            self.p4StatusLabel.setText(text)
+
+    def _populate_workspaces(self, workspaces):
+        """Fill the workspace list and restore the saved selection"""
+        if workspaces:
+            self.workspaces = workspaces
+
+            # Insert every row in one batch: no per-row repaints or signals
+            workspace_list = self.p4WorkspaceList
+            workspace_list.setUpdatesEnabled(False)
+            workspace_list.blockSignals(True)
+            try:
+                workspace_list.addItems(workspaces)
+            finally:
+                workspace_list.blockSignals(False)
+                workspace_list.setUpdatesEnabled(True)
+
+            self._workspace_index = {name: i for i, name in enumerate(workspaces)}
+            self._set_status(f"Status: Found {len(workspaces)} workspace(s)")
+            print(f"[Settings Qt] Found {len(workspaces)} workspaces")
+
+            # Select the saved workspace if it exists
+            row = self._workspace_index.get(self._pending_workspace)
+            if row is not None:
+                self.p4WorkspaceList.setCurrentRow(row)
+        else:
+            self._workspace_index = {}
+            self.p4WorkspaceList.addItem("(No workspaces found)")
+            self._set_status("Status: No workspaces found")
+
+        self._pending_workspace = ""
 
     def on_test_p4_connection(self):
         """Test P4 connection"""
-        server = self.p4ServerEdit.text()
-        user = self.p4UserEdit.text()
+        server = self.p4ServerEdit.text().strip()
+        user = self.p4UserEdit.text().strip()
 
         current_item = self.p4WorkspaceList.currentItem()
         workspace = current_item.text() if current_item else ""
@@ -310,32 +541,53 @@ class SettingsDialog(QDialog):
             )
             return
 
-        try:
+        # An explicit test forces the next workspace query to hit the server again
+        _WORKSPACE_CACHE.pop((server, user), None)
+
+        # Check the connection with 'p4 info' off the GUI thread
+        print(f"[Settings Qt] Testing P4 connection for {user}@{server} ({workspace})...")
+        self._set_status("Status: Testing connection...")
+        self.testP4Button.setEnabled(False)
+        self._p4_test_args = (server, user, workspace)
+        worker = _P4Worker(0, _query_info, self._p4_test_args, self._p4_test_signals)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_p4_test_finished(self, request_id, info_lines, status, error_msg):
+        """Report a finished connection test and apply the P4 environment (GUI thread)"""
+        self.testP4Button.setEnabled(True)
+        server, user, workspace = self._p4_test_args
+
+        if status == "ok":
             # Set P4 environment variables
             os.environ['P4PORT'] = server
             os.environ['P4USER'] = user
             os.environ['P4CLIENT'] = workspace
 
-            self.p4StatusLabel.setText("Status: Connection configured")
+            self._set_status("Status: Connected")
             QMessageBox.information(
                 self,
                 "P4 Configuration",
-                f"Perforce settings configured:\n\n"
+                f"Perforce connection OK:\n\n"
                 f"Server: {server}\n"
                 f"User: {user}\n"
                 f"Workspace: {workspace}\n\n"
                 f"Environment variables have been set."
             )
             print("[Settings Qt] P4 configuration set successfully")
+            return
 
-        except Exception as e:
-            self.p4StatusLabel.setText(f"Status: Error - {str(e)}")
-            QMessageBox.critical(
-                self,
-                "Connection Error",
-                f"Failed to test P4 connection:\n{str(e)}"
-            )
-            logger.error(f"P4 connection test failed: {str(e)}")
+        if status == "not_found":
+            error_msg = "P4 CLI not installed"
+        elif status == "timeout":
+            error_msg = "Connection timeout"
+
+        self._set_status(f"Status: Error - {error_msg[:30]}")
+        QMessageBox.critical(
+            self,
+            "Connection Error",
+            f"Failed to test P4 connection:\n{error_msg}"
+        )
+        logger.error(f"P4 connection test failed: {error_msg}")
 
     def on_browse_fbx_path(self):
         """Browse for FBX export directory"""
@@ -382,46 +634,51 @@ class SettingsDialog(QDialog):
     def on_save_settings(self):
         """Save settings to config"""
         try:
-            # Save P4 settings
-            config.set('perforce.server', self.p4ServerEdit.text())
-            config.set('perforce.user', self.p4UserEdit.text())
-
             # Get selected workspace
             current_item = self.p4WorkspaceList.currentItem()
-            workspace = current_item.text() if current_item else ""
+            if current_item:
+                workspace = current_item.text()
+            else:
+                # While the query is in flight the saved workspace is not listed yet
+                workspace = self._pending_workspace
             if workspace.startswith("("):
                 workspace = ""
-            config.set('perforce.workspace', workspace)
 
-            # Save export settings
+            # Validate export settings
             fbx_path = self.fbxPathEdit.text()
             if fbx_path:
                 path_obj = Path(fbx_path)
-                if not path_obj.exists():
+                try:
+                    path_obj.stat()
+                except OSError:
+                    # Missing, or not a valid path on this platform; mkdir reports the latter
                     reply = QMessageBox.question(
                         self,
                         "Path Not Found",
                         f"The path does not exist:\n{fbx_path}\n\nCreate it?",
                         QMessageBox.Yes | QMessageBox.No
                     )
-                    if reply == QMessageBox.Yes:
-                        try:
-                            path_obj.mkdir(parents=True, exist_ok=True)
-                        except Exception as e:
-                            QMessageBox.critical(
-                                self,
-                                "Error",
-                                f"Failed to create directory:\n{str(e)}"
-                            )
-                            return
-                    else:
+                    if reply != QMessageBox.Yes:
+                        return
+                    try:
+                        path_obj.mkdir(parents=True, exist_ok=True)
+                    except Exception as e:
+                        QMessageBox.critical(
+                            self,
+                            "Error",
+                            f"Failed to create directory:\n{str(e)}"
+                        )
                         return
 
-            config.set('export.fbx_path', fbx_path)
-            config.set('export.character_rigs_path', self.charRigsPathEdit.text())
-            config.set('export.character_animations_path', self.charAnimsPathEdit.text())
-
-            # Save to file
+            # Apply P4 and export settings together, then save to file
+            config.update({
+                'perforce.server': self.p4ServerEdit.text(),
+                'perforce.user': self.p4UserEdit.text(),
+                'perforce.workspace': workspace,
+                'export.fbx_path': fbx_path,
+                'export.character_rigs_path': self.charRigsPathEdit.text(),
+                'export.character_animations_path': self.charAnimsPathEdit.text(),
+            })
             config.save()
 
             QMessageBox.information(
@@ -449,11 +706,15 @@ class SettingsDialog(QDialog):
         )
 
         if reply == QMessageBox.Yes:
+            # Drop any workspace query still in flight so it cannot refill the list
+            self._p4_request_id += 1
+            self._p4_request_key = None
+            self._pending_workspace = ""
             self.p4ServerEdit.clear()
             self.p4UserEdit.clear()
             self.p4WorkspaceList.clear()
             self.fbxPathEdit.clear()
-            self.p4StatusLabel.setText("Status: Not connected")
+            self._set_status("Status: Not connected")
             print("[Settings Qt] Settings reset to defaults")
 
     def on_apply_and_close(self):
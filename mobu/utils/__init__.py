@@ -27,7 +27,15 @@ from .mobu_utils import (
     register_file_callback,
     register_scene_callback,
     # Qt widget utilities
-    refresh_list_widget
+    refresh_list_widget,
+    get_ui_bytes
+)
+from .character_presets import (
+    CHARACTER_SLOTS,
+    SLOT_INDEX,
+    NONE_LABELS,
+    PRESET_ENCODER,
+    PresetIndex
 )
 
 __all__ = [
@@ -57,5 +65,12 @@ __all__ = [
     'register_file_callback',
     'register_scene_callback',
     # Qt widget utilities
-    'refresh_list_widget'
+    'refresh_list_widget',
+    'get_ui_bytes',
+    # Character preset utilities
+    'CHARACTER_SLOTS',
+    'SLOT_INDEX',
+    'NONE_LABELS',
+    'PRESET_ENCODER',
+    'PresetIndex'
 ]
@@ -0,0 +1,118 @@
+"""
+Character Preset Utilities
+
+Bone slot tables and preset file helpers shared by the Character Mapper tools
+(the Qt dialog and the legacy FBTool version).
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+# =============================================================================
+# Character Slots
+# =============================================================================
+
+# Character bone slots in logical order
+# REQUIRED bones: Hips, Spine, LeftUpLeg, RightUpLeg
+# OPTIONAL bones: All other bones including Spine1-9, arms, hands, feet, neck, head, etc.
+# Note: Only ONE Spine bone is required. Additional spine bones provide more control.
+CHARACTER_SLOTS = [
+    # Reference
+    ("Reference", "Reference"),
+
+    # Hips and Spine
+    ("Hips", "Hips"),                    # REQUIRED
+    ("Spine", "Spine"),                  # REQUIRED (only this one, not Spine1-9)
+    ("Spine1", "Spine1"),                # Optional
+    ("Spine2", "Spine2"),                # Optional
+    ("Spine3", "Spine3"),                # Optional
+    ("Spine4", "Spine4"),                # Optional
+    ("Spine5", "Spine5"),                # Optional
+    ("Spine6", "Spine6"),                # Optional
+    ("Spine7", "Spine7"),                # Optional
+    ("Spine8", "Spine8"),                # Optional
+    ("Spine9", "Spine9"),                # Optional
+
+    # Neck and Head
+    ("Neck", "Neck"),
+    ("Head", "Head"),
+
+    # Left Arm
+    ("LeftShoulder", "LeftShoulder"),
+    ("LeftArm", "LeftArm"),
+    ("LeftForeArm", "LeftForeArm"),
+    ("LeftHand", "LeftHand"),
+
+    # Right Arm
+    ("RightShoulder", "RightShoulder"),
+    ("RightArm", "RightArm"),
+    ("RightForeArm", "RightForeArm"),
+    ("RightHand", "RightHand"),
+
+    # Left Leg
+    ("LeftUpLeg", "LeftUpLeg"),
+    ("LeftLeg", "LeftLeg"),
+    ("LeftFoot", "LeftFoot"),
+
+    # Right Leg
+    ("RightUpLeg", "RightUpLeg"),
+    ("RightLeg", "RightLeg"),
+    ("RightFoot", "RightFoot"),
+]
+
+# Slot name -> mapping list row
+SLOT_INDEX = {slot_name: i for i, (slot_name, _) in enumerate(CHARACTER_SLOTS)}
+
+# Display labels for unmapped slots, parallel to CHARACTER_SLOTS
+NONE_LABELS = [f"{slot_name}: <None>" for slot_name, _ in CHARACTER_SLOTS]
+
+
+# =============================================================================
+# Preset Files
+# =============================================================================
+
+# Shared encoder for presets: compact, UTF-8 as-is, and no cycle check for the flat dict
+PRESET_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, check_circular=False)
+
+
+class PresetIndex:
+    """
+    Names of the presets (file stems) in a presets directory.
+
+    The directory is scanned on the first lookup rather than on creation, and
+    rescanned when a name is missing in case a file was added outside the tool.
+    Names are compared with os.path.normcase, so lookups are case-insensitive
+    on Windows like the file system itself.
+
+    Example:
+        >>> index = PresetIndex(preset_dir)
+        >>> if not index.has("Hero"):
+        ...     print("Preset not found")
+        >>> index.add("Hero")  # After saving Hero.json
+    """
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory: Path of the presets directory
+        """
+        self.directory = Path(directory)
+        self._names = None
+
+    def refresh(self):
+        """Re-read the preset names available in the directory"""
+        self._names = {os.path.normcase(p.stem) for p in self.directory.glob("*.json")}
+
+    def has(self, preset_name):
+        """Check the index, rescanning once if the name is not known yet"""
+        key = os.path.normcase(preset_name)
+        if self._names is None or key not in self._names:
+            self.refresh()
+        return key in self._names
+
+    def add(self, preset_name):
+        """Record a preset written by the tool (no-op until the first scan)"""
+        if self._names is not None:
+            self._names.add(os.path.normcase(preset_name))
@@ -7,6 +7,8 @@ API Reference:
 https://download.autodesk.com/us/motionbuilder/sdk-documentation/PythonSDK/namespacepyfbsdk.html
 """
 
+import traceback
+from pathlib import Path
 from typing import List, Optional, Callable
 from pyfbsdk import (
     FBModel, FBModelList, FBGetSelectedModels, FBSystem, FBApplication
@@ -207,13 +209,15 @@ def find_models_by_pattern(pattern):
     return matching_models
 
 
-def get_all_models(include_children=True):
+def get_all_models(include_children=True, exclude_types=None):
     """
     Get all models in the scene.
 
     Args:
         include_children (bool): If True, recursively includes all children.
                                 If False, only returns top-level models.
+        exclude_types (tuple): Optional model types to skip during the scene walk
+                               (e.g. (FBCamera,)).
 
     Returns:
         List[FBModel]: List of all scene models
@@ -224,6 +228,10 @@ def get_all_models(include_children=True):
         >>>
         >>> # Only top-level models
         >>> top_level = get_all_models(include_children=False)
+        >>>
+        >>> # Everything except cameras
+        >>> from pyfbsdk import FBCamera
+        >>> models = get_all_models(exclude_types=(FBCamera,))
     """
     scene = FBSystem().Scene
     models = []
@@ -231,6 +239,8 @@ def get_all_models(include_children=True):
     # Get all components that are models
     for comp in scene.Components:
         if isinstance(comp, FBModel):
+            if exclude_types and isinstance(comp, exclude_types):
+                continue
             models.append(comp)
 
     return models
@@ -580,18 +590,50 @@ def register_scene_callback(callback: Callable) -> SceneEventManager:
 # Qt Widget Utilities
 # =============================================================================
 
+# Contents of .ui files already read this session, by path
+_UI_BYTES_CACHE = {}
+
+
+def get_ui_bytes(ui_file) -> Optional[bytes]:
+    """
+    Return the contents of a Qt Designer .ui file, reading it from disk only on first use.
+
+    Args:
+        ui_file: Path of the .ui file
+
+    Returns:
+        bytes: File contents, or None if the file could not be read
+
+    Example:
+        >>> ui_bytes = get_ui_bytes(Path(__file__).parent / "my_tool.ui")
+        >>> if ui_bytes is None:
+        ...     print("UI file not found")
+    """
+    key = str(ui_file)
+    ui_bytes = _UI_BYTES_CACHE.get(key)
+    if ui_bytes is None:
+        try:
+            ui_bytes = Path(ui_file).read_bytes()
+        except OSError:
+            return None
+        _UI_BYTES_CACHE[key] = ui_bytes
+    return ui_bytes
+
+
 def refresh_list_widget(
     parent_widget,
     list_widget_name: str,
     models: List[FBModel],
     selected_objects: Optional[List[FBModel]] = None,
-    tool_name: str = "Tool"
+    tool_name: str = "Tool",
+    names: Optional[List[str]] = None,
+    list_widget=None
 ):
     """
     Refresh a Qt list widget with MotionBuilder models.
 
     This is the standard pattern for updating scene object lists in Qt dialogs.
-    Re-finds the widget, clears it, populates with model names, and forces UI updates.
+    Resolves the widget, clears it and populates it with model names.
 
     Args:
         parent_widget: Qt dialog/widget containing the list widget (usually self)
@@ -599,6 +641,10 @@ def refresh_list_widget(
         models: List of FBModel objects to display
         selected_objects: Optional list to clean up (removes deleted models)
         tool_name: Name of the tool (for logging)
+        names: Optional display names parallel to models. Pass these when the
+               caller already read model.Name, to avoid reading it again.
+        list_widget: Optional cached QListWidget reference. Used as-is while it
+                     is still alive; otherwise the widget is re-found by name.
 
     Returns:
         bool: True if refresh succeeded, False if widget not found
@@ -621,10 +667,11 @@ def refresh_list_widget(
         ...     )
 
     Notes:
-        - Re-finds the widget each time for reliability (handles widget lifecycle)
-        - Clears and repopulates the entire list
-        - Forces Qt widget updates (update, repaint)
-        - Forces MotionBuilder UI update (UpdateAllWidgets)
+        - Re-finds the widget by name only when no live cached reference is passed
+          (handles widget lifecycle)
+        - Clears and repopulates the entire list in one batch (updates and
+          signals are suspended while rows are added)
+        - Only repaints the list itself; no global MotionBuilder UpdateAllWidgets
         - Cleans up selected_objects list if provided
         - Returns False if widget can't be found (safe to ignore)
     """
@@ -638,41 +685,50 @@ def refresh_list_widget(
         logger.error(f"[{tool_name}] Qt not available for refresh_list_widget")
         return False
 
-    # Re-find the widget each time to ensure we have a valid reference
-    list_widget = parent_widget.findChild(QtWidgets.QListWidget, list_widget_name)
+    # Use the cached reference unless its C++ object has been deleted
+    if list_widget is not None:
+        try:
+            list_widget.count()
+        except RuntimeError:
+            list_widget = None
+
+    # Fall back to walking the widget tree for a valid reference
+    if list_widget is None:
+        list_widget = parent_widget.findChild(QtWidgets.QListWidget, list_widget_name)
 
     if not list_widget:
         logger.warning(f"[{tool_name}] Could not find list widget '{list_widget_name}'")
         return False
 
     try:
-        # Clear the list
-        list_widget.clear()
+        if names is None:
+            names = [model.Name for model in models]
 
-        # Populate the list widget
-        for model in models:
-            list_widget.addItem(model.Name)
+        # Rebuild in one batch: no per-row repaints or signals, a single
+        # repaint once updates are re-enabled
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            list_widget.addItems(names)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
 
         logger.debug(f"[{tool_name}] List updated with {len(models)} objects")
 
-        # Force Qt widget updates
-        list_widget.update()
-        list_widget.repaint()
-
-        # Force MotionBuilder UI update
-        FBApplication().UpdateAllWidgets()
-
         # Clean up selected_objects list if provided - remove any deleted objects
         if selected_objects is not None:
-            # Remove objects that are no longer in the models list
-            removed = []
-            for i in range(len(selected_objects) - 1, -1, -1):
-                if selected_objects[i] not in models:
-                    removed.append(selected_objects[i])
-                    del selected_objects[i]
+            # Remove objects that are no longer in the models list (set lookup
+            # instead of scanning models once per selected object)
+            scene_set = set(models)
+            kept = [obj for obj in selected_objects if obj in scene_set]
+            removed_count = len(selected_objects) - len(kept)
 
-            if removed:
-                logger.debug(f"[{tool_name}] Cleaned up {len(removed)} deleted objects from selection")
+            if removed_count:
+                # Update in place, callers hold a reference to this list
+                selected_objects[:] = kept
+                logger.debug(f"[{tool_name}] Cleaned up {removed_count} deleted objects from selection")
 
         return True
 
@@ -681,6 +737,5 @@ def refresh_list_widget(
         return False
     except Exception as e:
         logger.error(f"[{tool_name}] Error refreshing list widget: {e}")
-        import traceback
         traceback.print_exc()
         return False